@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User, Board, List, Task
+from .models import User, Board, BoardTemplate, List, Task
 
 # Register your models here.
 class UserAdmin(admin.ModelAdmin):
@@ -14,6 +14,12 @@ class BoardAdmin(admin.ModelAdmin):
     list_filter = ['users']
     class Meta:
         model = Board
+
+
+class BoardTemplateAdmin(admin.ModelAdmin):
+    list_display = ('name', 'title', 'updated_at')
+    class Meta:
+        model = BoardTemplate
     
 
 admin.site.unregister(User)
@@ -21,3 +27,4 @@ admin.site.register(User, UserAdmin)
 admin.site.register(Board, BoardAdmin)
 admin.site.register(List)
 admin.site.register(Task)
+admin.site.register(BoardTemplate, BoardTemplateAdmin)
@@ -0,0 +1,10 @@
+from django.urls import path
+from .async_views import AsyncBoardDetail, AsyncListList, AsyncTaskList
+from .views import BoardRetrieveUpdateDestroy, ListListCreate, TaskListCreate
+
+
+urlpatterns = [
+    path('board/<int:board_pk>/', AsyncBoardDetail.as_view(sync_view=BoardRetrieveUpdateDestroy.as_view()), name='board-detail'),
+    path('board/<int:board_pk>/list/', AsyncListList.as_view(sync_view=ListListCreate.as_view()), name='list-list-create'),
+    path('board/<int:board_pk>/list/<int:list_pk>/task/', AsyncTaskList.as_view(sync_view=TaskListCreate.as_view()), name='task-list-create'),
+]
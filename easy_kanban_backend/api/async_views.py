@@ -0,0 +1,119 @@
+"""
+Async-native versions of the hot read endpoints.
+
+Under ASGI every DRF view is run as a whole through ``sync_to_async``. The
+views below serve plain GETs of a board, its lists and the tasks of a list as
+async views instead, which saves that hop along with DRF's request, content
+negotiation, permission and serializer machinery. They do not take the
+database off threads: on Django 5.1 ``aget``, ``aexists``, ``async for`` over
+a queryset and the cache's ``aget``/``aset`` are ``sync_to_async`` wrappers
+themselves, so a request still makes a few short thread hops, one per query
+or cache call. The JSON is the same as the DRF views render, built by the
+``arender_*`` functions of api/fastpath.py.
+
+Anything else sent to these URLs, other methods, query parameters such as
+``?fields=`` or pagination, and browsers asking for the browsable API, is
+passed on to the DRF view unchanged. The views are routed from asgi.py when
+the ``ASYNC_READ_VIEWS`` setting is on, see easy_kanban_backend/async_urls.py.
+"""
+from asgiref.sync import sync_to_async
+from django.db.models import Exists, OuterRef, Value
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated, NotFound, PermissionDenied
+
+from api.authentication import CachedJWTAuthentication
+from api.cache import aget_board_payload, board_etag
+from api.fastpath import arender_board, arender_lists, arender_tasks
+from api.models import Board, List, Task
+from api.renderers import FastJSONRenderer
+from api.views import is_claimed_board
+
+_renderer = FastJSONRenderer()
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    return HttpResponse(_renderer.render(data), content_type='application/json', status=status, headers=headers)
+
+
+# like APIView.as_view, CSRF is left to DRF's SessionAuthentication of the sync view
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncReadView(View):
+    """Answer plain GETs with ``get``, hand every other request to ``sync_view``."""
+    sync_view = None
+    authentication = CachedJWTAuthentication()
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method != 'GET' or request.GET or 'text/html' in request.headers.get('Accept', ''):
+            return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+        try:
+            await self.authenticate(request)
+            return await self.get(request, *args, **kwargs)
+        except APIException as exc:
+            return self.handle_exception(request, exc)
+
+    async def authenticate(self, request):
+        result = await self.authentication.aauthenticate(request)
+        if result is None:
+            raise NotAuthenticated()
+        request.user, request.auth = result
+
+    def handle_exception(self, request, exc):
+        # same body and headers as rest_framework.views.exception_handler
+        headers = {}
+        if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            headers['WWW-Authenticate'] = self.authentication.authenticate_header(request)
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        return json_response(data, exc.status_code, headers)
+
+    async def get_member_board(self, request, board_pk):
+        """Return the board like api.views.get_member_board, raising NotFound or PermissionDenied."""
+        if is_claimed_board(request, board_pk):
+            queryset = Board.objects.annotate(is_member=Value(True))
+        else:
+            membership = Board.users.through.objects.filter(board_id=OuterRef('pk'), user_id=request.user.id)
+            queryset = Board.objects.annotate(is_member=Exists(membership))
+        try:
+            board = await queryset.aget(pk=board_pk)
+        except Board.DoesNotExist:
+            raise NotFound('No Board matches the given query.')
+        if not board.is_member:
+            raise PermissionDenied()
+        return board
+
+    async def check_member(self, request, board_pk):
+        if not is_claimed_board(request, board_pk):
+            await self.get_member_board(request, board_pk)
+
+
+class AsyncBoardDetail(AsyncReadView):
+
+    async def get(self, request, board_pk):
+        board = await self.get_member_board(request, board_pk)
+        etag = board_etag(board, f'board_pk:{board_pk}')
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        payload = await aget_board_payload(board, lambda: arender_board(board_pk))
+        if payload is None:
+            raise NotFound('No Board matches the given query.')
+        return json_response(payload, headers={'ETag': etag})
+
+
+class AsyncListList(AsyncReadView):
+
+    async def get(self, request, board_pk):
+        await self.check_member(request, board_pk)
+        return json_response(await arender_lists(List.objects.filter(board_id=board_pk)))
+
+
+class AsyncTaskList(AsyncReadView):
+
+    async def get(self, request, board_pk, list_pk):
+        await self.check_member(request, board_pk)
+        if not await List.objects.filter(pk=list_pk, board_id=board_pk).aexists():
+            raise NotFound('No List matches the given query.')
+        return json_response(await arender_tasks(Task.objects.filter(list_id=list_pk)))
@@ -0,0 +1,60 @@
+"""
+JWT authentication with the token's user cached.
+
+SimpleJWT loads the user named by the ``user_id`` claim on every request.
+``CachedJWTAuthentication`` keeps that user in Django's cache for
+``AUTH_USER_CACHE_TIMEOUT`` seconds instead, so authenticated requests do
+not query auth_user. The entry is dropped whenever the user is saved or
+deleted (see api/signals.py), so deactivating a user or changing their
+password takes effect on the next request.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+def user_cache_key(user_id):
+    return f'auth-user:{user_id}'
+
+
+def invalidate_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # only users that passed every check of SimpleJWT are cached
+            user = super().get_user(validated_token)
+            cache.set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+        elif api_settings.CHECK_REVOKE_TOKEN and validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+        return user
+
+    async def aauthenticate(self, request):
+        """``authenticate`` for the async views, a cache miss loads the user with the sync ``get_user``."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = None if user_id is None else await cache.aget(user_cache_key(user_id))
+        if user is not None and not api_settings.CHECK_REVOKE_TOKEN:
+            return user
+        return await sync_to_async(self.get_user)(validated_token)
@@ -0,0 +1,110 @@
+"""
+Batched list and task operations on one board.
+
+A batch is an ordered array of ``create``, ``update``, ``move`` and ``delete`` operations. Lists and
+tasks are addressed by their integer id, or by the ``ref`` string given to an item created earlier in
+the same batch, and only items of the batch's board can be reached. ``apply_batch`` runs inside the
+caller's transaction and raises a ``BatchOperationError`` naming the failing operation, so a batch is
+applied completely or not at all.
+"""
+from rest_framework.exceptions import ValidationError
+
+from api.models import List, Task, Tombstone
+from api.ordering import append, make_room, next_position
+from api.serializers import ListSerializer, TaskPatchSerializer, TaskSerializer
+
+# fields changed with a move operation rather than an update
+MOVE_FIELDS = ('list', 'position')
+
+
+class BatchOperationError(ValidationError):
+    """A ValidationError with the ``index`` of the failing operation and its ``errors``, the index kept an integer."""
+
+    def __init__(self, index, errors):
+        super().__init__()
+        self.detail = {'index': index, 'errors': errors}
+
+
+class BoardBatch:
+
+    def __init__(self, board):
+        self.board = board
+        self.refs = {'list': {}, 'task': {}}
+
+    def apply(self, operations):
+        results = []
+        for index, operation in enumerate(operations):
+            try:
+                results.append(getattr(self, operation['op'])(operation))
+            except ValidationError as error:
+                raise BatchOperationError(index, error.detail)
+        return results
+
+    def lists(self):
+        return List.objects.filter(board=self.board)
+
+    def get(self, kind, reference, field='id'):
+        # strings are refs and ints ids, a ref that was never created is not taken for an id
+        pk = self.refs[kind].get(reference) if isinstance(reference, str) else reference
+        queryset = self.lists() if kind == 'list' else Task.objects.filter(list__board=self.board)
+        try:
+            return queryset.get(pk=pk)
+        except (List.DoesNotExist, Task.DoesNotExist):
+            raise ValidationError({field: f'{kind.capitalize()} {reference} not found'})
+
+    def create(self, operation):
+        if operation['type'] == 'list':
+            serializer = ListSerializer(data=operation['data'])
+            serializer.is_valid(raise_exception=True)
+            instance = append(serializer, self.board, self.lists(), board=self.board)
+        else:
+            task_list = self.get('list', operation['list'], field='list')
+            serializer = TaskSerializer(data=operation['data'])
+            serializer.is_valid(raise_exception=True)
+            instance = append(serializer, task_list, Task.objects.filter(list=task_list), list=task_list)
+        if 'ref' in operation:
+            self.refs[operation['type']][operation['ref']] = instance.pk
+        return self.result(operation, instance)
+
+    def update(self, operation):
+        instance = self.get(operation['type'], operation['id'])
+        if any(field in operation['data'] for field in MOVE_FIELDS):
+            raise ValidationError({'data': 'Use a move operation to change list or position'})
+        serializer = self.serializer_class(operation)(instance, data=operation['data'], partial=True)
+        serializer.is_valid(raise_exception=True)
+        return self.result(operation, serializer.save())
+
+    def move(self, operation):
+        instance = self.get(operation['type'], operation['id'])
+        if operation['type'] == 'list':
+            instance.position = make_room(instance, self.lists(), operation['position'])
+            instance.save(update_fields=['position', 'updated_at'])
+            return self.result(operation, instance)
+        if 'list' in operation:
+            instance.list = self.get('list', operation['list'], field='list')
+        siblings = Task.objects.filter(list_id=instance.list_id)
+        if 'position' in operation:
+            instance.position = make_room(instance, siblings, operation['position'])
+        else:
+            instance.position = next_position(siblings.exclude(pk=instance.pk))
+        instance.save(update_fields=['list', 'position', 'updated_at'])
+        return self.result(operation, instance)
+
+    def delete(self, operation):
+        instance = self.get(operation['type'], operation['id'])
+        Tombstone.objects.create(board=self.board, kind=operation['type'], object_id=instance.pk)
+        result = {'op': 'delete', 'type': operation['type'], 'id': instance.pk}
+        instance.delete()
+        return result
+
+    def serializer_class(self, operation):
+        return ListSerializer if operation['type'] == 'list' else TaskPatchSerializer
+
+    def result(self, operation, instance):
+        data = self.serializer_class(operation)(instance).data
+        return {'op': operation['op'], 'type': operation['type'], 'id': instance.pk, 'data': data}
+
+
+def apply_batch(board, operations):
+    """Apply ``operations`` to ``board`` and return one result per operation."""
+    return BoardBatch(board).apply(operations)
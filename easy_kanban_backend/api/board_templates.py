@@ -0,0 +1,67 @@
+"""
+Board templates.
+
+Templates are ``BoardTemplate`` rows, editable in the admin. All of them are
+read with one query the first time one is needed and kept in memory, the copy
+is dropped when a template is saved or deleted in this process (see
+api/signals.py). Other processes keep serving their copy for at most
+``TEMPLATE_CACHE_SECONDS``. Templates are validated as they are loaded, one
+whose lists would not pass a board import, e.g. saved from the shell or a
+fixture without going through ``BoardTemplate.clean``, is logged and left out.
+
+A board is created from a template by ``BoardImporter``, with one bulk INSERT
+each for the board, its memberships, lists and tasks, so the number of queries
+does not depend on the size of the template.
+"""
+import logging
+import time
+
+from api.importing import BoardImporter
+from api.models import BoardTemplate
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_CACHE_SECONDS = 300
+
+_templates = None
+_loaded_at = 0
+
+
+def get_templates():
+    """Return the templates as ``{name: {'title': ..., 'lists': [...]}}``."""
+    global _templates, _loaded_at
+    if _templates is None or time.monotonic() - _loaded_at > TEMPLATE_CACHE_SECONDS:
+        _templates = load_templates()
+        _loaded_at = time.monotonic()
+    return _templates
+
+
+def load_templates():
+    from api.serializers import ImportListSerializer
+    templates = {}
+    for name, title, lists in BoardTemplate.objects.values_list('name', 'title', 'lists'):
+        serializer = ImportListSerializer(data=lists, many=True)
+        if serializer.is_valid():
+            templates[name] = {'title': title, 'lists': serializer.validated_data}
+        else:
+            logger.warning('Board template %r is invalid and left out: %s', name, serializer.errors)
+    return templates
+
+
+def clear_templates():
+    global _templates
+    _templates = None
+
+
+def create_from_template(importer, name, title=None):
+    """Queue a board built from the template ``name`` on ``importer`` and return it, unsaved until the importer flushes."""
+    template = get_templates()[name]
+    return importer.add_board({'title': title or template['title'], 'lists': template['lists']})
+
+
+def instantiate(name, user_ids, title=None):
+    """Create a board from the template ``name`` for ``user_ids`` and return it. Run it inside a transaction."""
+    importer = BoardImporter(user_ids)
+    board = create_from_template(importer, name, title)
+    importer.finish()
+    return board
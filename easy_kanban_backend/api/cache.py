@@ -0,0 +1,67 @@
+"""
+Read-through cache for serialized boards.
+
+Payloads are stored in Django's cache framework under a key that includes
+the board version. Every list or task write made through the API bumps the
+version in the same transaction, so a read after a write always misses the
+old entry instead of serving stale data, and unchanged boards are served
+without touching the List/Task tables.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils.http import quote_etag
+
+from api.models import Board
+
+
+def board_cache_key(board):
+    # created_at guards against a new board reusing the primary key of a deleted one
+    return f'board:{board.pk}:{int(board.created_at.timestamp() * 1000000)}:v{board.version}'
+
+
+def board_etag(board, resource):
+    """Strong ETag of ``resource`` (e.g. ``'task_pk:3'``) at the current version of its board."""
+    digest = hashlib.md5(f'{board_cache_key(board)}:{resource}'.encode(), usedforsecurity=False).hexdigest()
+    return quote_etag(digest)
+
+
+def get_board_payload(board, render, variant=''):
+    """
+    Return the cached payload of ``board`` at its current version, calling ``render`` on a miss.
+
+    ``variant`` tells apart representations of the same board, such as sparse fieldsets.
+    """
+    key = board_payload_key(board, variant)
+    payload = cache.get(key)
+    if payload is None:
+        payload = render()
+        cache.set(key, payload, settings.BOARD_CACHE_TIMEOUT)
+    return payload
+
+
+async def aget_board_payload(board, render):
+    """``get_board_payload`` for async views, ``render`` is a coroutine function."""
+    key = board_payload_key(board)
+    payload = await cache.aget(key)
+    if payload is None:
+        payload = await render()
+        await cache.aset(key, payload, settings.BOARD_CACHE_TIMEOUT)
+    return payload
+
+
+def board_payload_key(board, variant=''):
+    key = board_cache_key(board)
+    if variant:
+        key = f"{key}:{hashlib.md5(variant.encode(), usedforsecurity=False).hexdigest()}"
+    return key
+
+
+def bump_board_version(board_id, expected_version=None):
+    """Increment the board version, only if it still equals ``expected_version`` when that is given."""
+    boards = Board.objects.filter(pk=board_id)
+    if expected_version is not None:
+        boards = boards.filter(version=expected_version)
+    return boards.update(version=F('version') + 1)
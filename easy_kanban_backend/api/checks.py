@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+# cache backends whose entries are only visible to the process that wrote them, or not kept at all
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register()
+def check_membership_claims_cache(app_configs, **kwargs):
+    """Membership claims are revoked through the cache, so every worker has to see the same cache."""
+    if settings.MEMBERSHIP_CLAIMS and settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+        return [Error(
+            'MEMBERSHIP_CLAIMS requires a cache shared by all workers.',
+            hint='Set CACHE_BACKEND to a shared backend such as django.core.cache.backends.redis.RedisCache, '
+                 'otherwise a removed member keeps access through workers that did not see the removal.',
+            id='api.E001',
+        )]
+    return []
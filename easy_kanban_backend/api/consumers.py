@@ -0,0 +1,71 @@
+import time
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from api.authentication import CachedJWTAuthentication
+from api.events import board_group
+from api.models import Board
+
+# close codes telling the client why the socket was closed
+CLOSE_REVOKED = 4003
+CLOSE_TOKEN_EXPIRED = 4001
+
+
+class BoardConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Stream the list and task events of one board.
+
+    Browsers cannot set headers on WebSocket connections, so the SimpleJWT
+    access token is passed as the ``token`` query parameter.
+
+    Membership is checked when the socket connects. A user removed from the
+    board later, or whose board is deleted, is disconnected with
+    ``CLOSE_REVOKED`` by the ``board.revoke`` message of api/events.py. Once
+    the access token expires the socket is closed with ``CLOSE_TOKEN_EXPIRED``
+    instead of forwarding the next event, and the client reconnects with a
+    fresh token.
+    """
+    group_name = None
+    user_id = None
+    expires_at = None
+
+    async def connect(self):
+        board_pk = self.scope['url_route']['kwargs']['board_pk']
+        query = parse_qs(self.scope['query_string'].decode())
+        result = await self.authenticate(query.get('token', [''])[0])
+        if result is None or not await Board.users.through.objects.filter(board_id=board_pk, user_id=result[0].id).aexists():
+            await self.close()
+            return
+        user, token = result
+        self.user_id, self.expires_at = user.id, token['exp']
+        self.group_name = board_group(board_pk)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if self.group_name is not None:
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def board_event(self, message):
+        if time.time() >= self.expires_at:
+            await self.close(CLOSE_TOKEN_EXPIRED)
+            return
+        await self.send_json({'event': message['event'], 'data': message['data']})
+
+    async def board_revoke(self, message):
+        if message['user_ids'] is None or self.user_id in message['user_ids']:
+            await self.close(CLOSE_REVOKED)
+
+    @database_sync_to_async
+    def authenticate(self, raw_token):
+        """Return the user and validated token of ``raw_token``, None when it is not valid."""
+        authentication = CachedJWTAuthentication()
+        try:
+            token = authentication.get_validated_token(raw_token.encode())
+            return authentication.get_user(token), token
+        except (InvalidToken, AuthenticationFailed):
+            return None
@@ -0,0 +1,41 @@
+"""
+Push board mutations to WebSocket subscribers.
+
+Views publish an event to the ``board_<pk>`` group of the configured channel
+layer once their transaction commits, and every BoardConsumer connected to
+that board forwards it to its client. The in-memory layer is enough for a
+single process; point ``CHANNEL_LAYERS`` at a shared layer such as
+channels_redis to fan events out across nodes.
+
+Removing members from a board, or deleting it, sends a ``board.revoke``
+message to the same group, which closes the sockets of the users who lost
+access (see api/signals.py).
+"""
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+
+def board_group(board_id):
+    return f'board_{board_id}'
+
+
+def publish_board_event(board_id, event, data):
+    """Send ``event`` (e.g. ``'task.updated'``) with ``data`` to the board subscribers after commit."""
+    def send():
+        channel_layer = get_channel_layer()
+        if channel_layer is not None:
+            message = {'type': 'board.event', 'event': event, 'data': data}
+            async_to_sync(channel_layer.group_send)(board_group(board_id), message)
+    transaction.on_commit(send)
+
+
+def revoke_board_access(board_id, user_ids=None):
+    """Close the board sockets of ``user_ids`` after commit, those of every user when None."""
+    user_ids = None if user_ids is None else list(user_ids)
+
+    def send():
+        channel_layer = get_channel_layer()
+        if channel_layer is not None:
+            async_to_sync(channel_layer.group_send)(board_group(board_id), {'type': 'board.revoke', 'user_ids': user_ids})
+    transaction.on_commit(send)
@@ -0,0 +1,62 @@
+"""
+Streaming export of boards with their lists and tasks as NDJSON.
+
+The export is built from three queries, boards, lists and tasks, each read through a server-side
+cursor (``iterator(chunk_size=...)``) and sorted the same way so they can be merged in one pass.
+At most a chunk of each is held in memory at any time, whatever the size of the account.
+
+Records use the format accepted by the board import: every line has a ``type`` and belongs to the
+last board or list before it.
+
+Under ASGI Django collects a sync iterator given to StreamingHttpResponse into a list before sending
+it, so the export view streams through ``aiter_chunks`` there, which pulls the lines a chunk at a time.
+"""
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from api.models import List, Task
+
+CHUNK_SIZE = 2000
+
+
+def export_records(boards, chunk_size=CHUNK_SIZE):
+    """Yield a record for every board of the ``boards`` queryset, followed by its lists and their tasks."""
+    lists = (List.objects.filter(board__in=boards)
+             .order_by('board_id', 'position', 'id')
+             .values('id', 'board', 'title', 'position')
+             .iterator(chunk_size=chunk_size))
+    tasks = (Task.objects.filter(list__board__in=boards)
+             .order_by('list__board_id', 'list__position', 'list_id', 'position', 'id')
+             .values('id', 'list', 'title', 'description', 'position')
+             .iterator(chunk_size=chunk_size))
+    next_list = next(lists, None)
+    next_task = next(tasks, None)
+    for board in boards.order_by('id').values('id', 'title').iterator(chunk_size=chunk_size):
+        yield {'type': 'board', **board}
+        while next_list is not None and next_list['board'] == board['id']:
+            yield {'type': 'list', **next_list}
+            while next_task is not None and next_task['list'] == next_list['id']:
+                yield {'type': 'task', **next_task}
+                next_task = next(tasks, None)
+            next_list = next(lists, None)
+
+
+def to_ndjson(records):
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder) + '\n'
+
+
+async def aiter_chunks(lines, chunk_size=CHUNK_SIZE):
+    """
+    Yield the ``lines`` iterator joined in chunks of ``chunk_size`` lines, from an async iterator.
+
+    Every chunk is read in the thread that holds the request's database connection, so the
+    server-side cursors of ``export_records`` keep working.
+    """
+    take = sync_to_async(lambda: ''.join(islice(lines, chunk_size)), thread_sensitive=True)
+    while chunk := await take():
+        yield chunk
@@ -0,0 +1,93 @@
+"""
+Fast-path rendering of boards, lists and tasks for read endpoints.
+
+Produces the same data as BoardSerializer, ListSerializer, TaskSerializer and TaskPatchSerializer
+straight from ``values_list()`` rows: no model instances and no per-object serializer or field
+objects, just one query per level and a dict per row. Enabled with the ``FAST_READ_RENDERING``
+setting for requests without sparse fieldsets; api/tests/test_fastpath.py keeps the output in parity
+with the serializers, so changes to their fields must be mirrored here.
+
+The ``arender_*`` variants do the same with the async ORM for the views of api/async_views.py.
+"""
+from rest_framework.fields import DateTimeField
+
+from api.models import Board, List, Task
+
+TASK_FIELDS = ('id', 'title', 'description', 'position')
+TASK_PATCH_FIELDS = TASK_FIELDS + ('list',)
+
+# one shared field instance keeps datetimes formatted exactly like the serializers do
+_datetime = DateTimeField()
+
+
+def render_tasks(tasks, fields=TASK_FIELDS):
+    """Render the ``tasks`` queryset like ``TaskSerializer(tasks, many=True)``, or with ``fields``."""
+    return [dict(zip(fields, row)) for row in tasks.values_list(*fields)]
+
+
+async def arender_tasks(tasks, fields=TASK_FIELDS):
+    return [dict(zip(fields, row)) async for row in tasks.values_list(*fields)]
+
+
+def list_rows(lists):
+    return lists.values_list('id', 'title', 'position')
+
+
+def list_task_rows(lists):
+    return Task.objects.filter(list__in=lists.values('pk')).values_list('list_id', *TASK_FIELDS)
+
+
+def list_data(rows, task_rows):
+    tasks_by_list = {list_id: [] for list_id, _, _ in rows}
+    for list_id, *task in task_rows:
+        tasks_by_list[list_id].append(dict(zip(TASK_FIELDS, task)))
+    return [{'id': list_id, 'title': title, 'tasks': tasks_by_list[list_id], 'position': position}
+            for list_id, title, position in rows]
+
+
+def render_lists(lists):
+    """Render the ``lists`` queryset like ``ListSerializer(lists, many=True)``."""
+    rows = list(list_rows(lists))
+    return list_data(rows, list_task_rows(lists) if rows else [])
+
+
+async def arender_lists(lists):
+    rows = [row async for row in list_rows(lists)]
+    return list_data(rows, [row async for row in list_task_rows(lists)] if rows else [])
+
+
+def board_row(board_pk):
+    return Board.objects.filter(pk=board_pk).values_list('id', 'title', 'created_at', 'updated_at', 'version')
+
+
+def board_user_ids(board_id):
+    return Board.users.through.objects.filter(board_id=board_id).order_by('user_id').values_list('user_id', flat=True)
+
+
+def board_data(row, users, lists):
+    board_id, title, created_at, updated_at, version = row
+    return {
+        'id': board_id,
+        'users': users,
+        'lists': lists,
+        'title': title,
+        'created_at': _datetime.to_representation(created_at),
+        'updated_at': _datetime.to_representation(updated_at),
+        'version': version,
+    }
+
+
+def render_board(board_pk):
+    """Render a board like ``BoardSerializer``, or return None when it does not exist."""
+    row = board_row(board_pk).first()
+    if row is None:
+        return None
+    return board_data(row, list(board_user_ids(row[0])), render_lists(List.objects.filter(board_id=row[0])))
+
+
+async def arender_board(board_pk):
+    row = await board_row(board_pk).afirst()
+    if row is None:
+        return None
+    users = [user_id async for user_id in board_user_ids(row[0])]
+    return board_data(row, users, await arender_lists(List.objects.filter(board_id=row[0])))
@@ -0,0 +1,83 @@
+"""
+Bulk import of boards with their lists and tasks.
+
+BoardImporter collects validated rows and writes them with ``bulk_create``, one INSERT per model for
+every ``BATCH_SIZE`` rows instead of one per row. Parents are always flushed before their children so
+the children reference saved primary keys, and only the created ids are kept once a batch is written,
+which keeps memory flat for streamed imports. Run it inside a transaction so that an invalid record
+anywhere in the input discards the whole import.
+"""
+from api.models import Board, List, Task
+from api.ordering import position_step
+
+BATCH_SIZE = 1000
+
+
+class BoardImporter:
+
+    def __init__(self, user_ids, batch_size=BATCH_SIZE):
+        self.user_ids = list(user_ids)
+        self.batch_size = batch_size
+        self.step = position_step()
+        self.boards, self.lists, self.tasks = [], [], []
+        self.created = {'boards': [], 'lists': [], 'tasks': []}
+        self.board = self.list = None
+
+    def add_board(self, data):
+        """Queue a board and its nested lists; following lists without a board go to it."""
+        self.board = Board(title=data['title'])
+        self.list = None
+        self.list_position = 0
+        self.boards.append(self.board)
+        self.maybe_flush()
+        for list_data in data.get('lists', []):
+            self.add_list(list_data)
+        return self.board
+
+    def add_list(self, data):
+        """Queue a list of the last board and its nested tasks; following tasks go to it."""
+        if self.board is None:
+            raise ValueError('A list must follow a board')
+        position, self.list_position = self.position(data, self.list_position)
+        self.list = List(title=data['title'], board=self.board, position=position)
+        self.task_position = 0
+        self.lists.append(self.list)
+        self.maybe_flush()
+        for task_data in data.get('tasks', []):
+            self.add_task(task_data)
+        return self.list
+
+    def add_task(self, data):
+        """Queue a task of the last list."""
+        if self.list is None:
+            raise ValueError('A task must follow a list')
+        position, self.task_position = self.position(data, self.task_position)
+        task = Task(title=data['title'], description=data.get('description'), list=self.list, position=position)
+        self.tasks.append(task)
+        self.maybe_flush()
+        return task
+
+    def position(self, data, next_position):
+        position = data.get('position', next_position)
+        return position, max(next_position, position + self.step)
+
+    def maybe_flush(self):
+        if len(self.boards) + len(self.lists) + len(self.tasks) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        Board.objects.bulk_create(self.boards, batch_size=self.batch_size)
+        Board.users.through.objects.bulk_create(
+            [Board.users.through(board=board, user_id=user_id) for board in self.boards for user_id in self.user_ids],
+            batch_size=self.batch_size,
+        )
+        List.objects.bulk_create(self.lists, batch_size=self.batch_size)
+        Task.objects.bulk_create(self.tasks, batch_size=self.batch_size)
+        for key, objects in (('boards', self.boards), ('lists', self.lists), ('tasks', self.tasks)):
+            self.created[key].extend(obj.pk for obj in objects)
+        self.boards, self.lists, self.tasks = [], [], []
+
+    def finish(self):
+        """Write what is left and return the ids of everything created, in input order."""
+        self.flush()
+        return self.created
@@ -0,0 +1,23 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from api.exporting import CHUNK_SIZE, export_records, to_ndjson
+from api.models import Board
+
+
+class Command(BaseCommand):
+    help = "Export boards with their lists and tasks as NDJSON, the format accepted by the board import"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help="Only export the boards of this username")
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows fetched per database round trip")
+
+    def handle(self, *args, **options):
+        boards = Board.objects.all()
+        if options['user']:
+            try:
+                boards = boards.filter(users=User.objects.get(username=options['user']))
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']} does not exist")
+        for line in to_ndjson(export_records(boards, options['chunk_size'])):
+            self.stdout.write(line, ending='')
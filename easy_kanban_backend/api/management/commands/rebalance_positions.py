@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from api.models import Board, List
+from api.ordering import rebalance
+
+
+class Command(BaseCommand):
+    help = "Respace list and task positions for the configured POSITION_ORDERING, e.g. after switching modes"
+
+    def handle(self, *args, **options):
+        changed = 0
+        for board in Board.objects.iterator():
+            changed += rebalance(board.lists.all())
+        for task_list in List.objects.iterator():
+            changed += rebalance(task_list.tasks.all())
+        self.stdout.write(self.style.SUCCESS(f"Rebalanced {changed} positions"))
@@ -0,0 +1,83 @@
+"""
+Board memberships carried in access tokens.
+
+With ``MEMBERSHIP_CLAIMS`` on, access tokens issued by the token and token
+refresh endpoints carry the ids of the user's boards in the ``boards`` claim,
+together with the user's membership version in ``membership_version``.
+``IsBoardMember`` then authorizes a board from the token alone, without
+querying the board/user through table.
+
+The membership version lives in Django's cache and is dropped whenever one
+of the user's memberships is removed or one of their boards is deleted (see
+api/signals.py), so a token issued before the change no longer matches and
+the permission falls back to the database. A version evicted from the cache
+has the same effect. Boards the user joined after the token was issued are
+simply missing from the claim and checked in the database as well.
+
+Revocation is only as wide as the cache: with a per-process cache a worker
+that did not handle the removal keeps trusting the claim, so the ``api.E001``
+system check refuses ``MEMBERSHIP_CLAIMS`` with such a backend, as well as
+with the dummy cache, which keeps no version at all.
+"""
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.settings import api_settings
+
+from api.models import Board
+
+# users with more boards get no claim, keeping tokens small enough for a header
+MAX_CLAIMED_BOARDS = 200
+
+
+def membership_version_key(user_id):
+    return f'membership-version:{user_id}'
+
+
+def get_membership_version(user_id):
+    """Return the current membership version of the user, starting a new one if there is none."""
+    key = membership_version_key(user_id)
+    cache.add(key, uuid4().hex, None)
+    return cache.get(key)
+
+
+def invalidate_memberships(user_ids):
+    """
+    Drop the membership version of ``user_ids``, invalidating the claims of their tokens.
+
+    The version is dropped right away and again once the transaction commits, so a token issued
+    from the memberships that were still visible before the commit does not keep the old version.
+    """
+    keys = [membership_version_key(user_id) for user_id in user_ids]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def add_membership_claims(token, user_id):
+    # the version is read before the memberships, so a change in between leaves the claim outdated
+    version = get_membership_version(user_id)
+    board_ids = list(Board.users.through.objects.filter(user_id=user_id).order_by('board_id').values_list('board_id', flat=True)[:MAX_CLAIMED_BOARDS + 1])
+    # a cache that keeps nothing has no version to revoke, such a token carries no claim
+    if version is not None and len(board_ids) <= MAX_CLAIMED_BOARDS:
+        token['boards'] = board_ids
+        token['membership_version'] = version
+    return token
+
+
+def claimed_board_ids(request):
+    """
+    Return the ids of the boards the access token of ``request`` vouches for, None when it vouches for none.
+
+    Claims are only trusted while ``MEMBERSHIP_CLAIMS`` is on and their version is the user's current one,
+    never while the user has no version in the cache.
+    """
+    token = request.auth
+    if not settings.MEMBERSHIP_CLAIMS or token is None or 'membership_version' not in token:
+        return None
+    version = cache.get(membership_version_key(token[api_settings.USER_ID_CLAIM]))
+    if version is None or token['membership_version'] != version:
+        return None
+    return token['boards']
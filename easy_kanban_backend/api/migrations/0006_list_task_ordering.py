@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-16 23:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_list_position'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='list',
+            options={'ordering': ['position']},
+        ),
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['position']},
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db import migrations
+
+
+def respace_positions(apps, schema_editor):
+    # Same spacing as api.ordering.position_step() for the configured POSITION_ORDERING
+    step = 1024 if getattr(settings, 'POSITION_ORDERING', 'dense') == 'sparse' else 1
+    Board = apps.get_model('api', 'Board')
+    List = apps.get_model('api', 'List')
+    Task = apps.get_model('api', 'Task')
+    for board_id in Board.objects.values_list('pk', flat=True):
+        respace(List, List.objects.filter(board_id=board_id), step)
+    for list_id in List.objects.values_list('pk', flat=True):
+        respace(Task, Task.objects.filter(list_id=list_id), step)
+
+
+def respace(model, siblings, step):
+    items = list(siblings.order_by('position', 'pk'))
+    for index, item in enumerate(items):
+        item.position = index * step
+    model.objects.bulk_update(items, ['position'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_list_task_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(respace_positions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# FTS5 index over task titles and descriptions, used by api.search.SQLiteFTSBackend. It reads the
+# text from api_task (external content) and the triggers keep it in sync with every write, including
+# bulk inserts, queryset updates and cascading deletes.
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE api_task_fts USING fts5(
+        title, description, content='api_task', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER api_task_fts_insert AFTER INSERT ON api_task BEGIN
+        INSERT INTO api_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER api_task_fts_delete AFTER DELETE ON api_task BEGIN
+        INSERT INTO api_task_fts(api_task_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER api_task_fts_update AFTER UPDATE OF title, description ON api_task BEGIN
+        INSERT INTO api_task_fts(api_task_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO api_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    "INSERT INTO api_task_fts(api_task_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS api_task_fts_update",
+    "DROP TRIGGER IF EXISTS api_task_fts_delete",
+    "DROP TRIGGER IF EXISTS api_task_fts_insert",
+    "DROP TABLE IF EXISTS api_task_fts",
+]
+
+
+def run_on_sqlite(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == 'sqlite':
+            for statement in statements:
+                schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_on_sqlite(SQLITE_FORWARD), run_on_sqlite(SQLITE_BACKWARD)),
+    ]
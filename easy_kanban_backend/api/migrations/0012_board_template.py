@@ -0,0 +1,59 @@
+# Generated by Django 5.1.2 on 2026-10-17 00:57
+
+from django.db import migrations, models
+
+TEMPLATES = [
+    {
+        'name': 'kanban',
+        'title': 'My Board',
+        'lists': [{'title': 'To Do'}, {'title': 'In Progress'}, {'title': 'Done'}],
+    },
+    {
+        'name': 'scrum',
+        'title': 'Sprint Board',
+        'lists': [
+            {'title': 'Backlog', 'tasks': [
+                {'title': 'Write the first user story', 'description': 'As a <role> I want <goal> so that <benefit>.'},
+            ]},
+            {'title': 'Sprint', 'tasks': [
+                {'title': 'Plan the sprint', 'description': 'Move the stories the team commits to into this list.'},
+            ]},
+            {'title': 'In Progress'},
+            {'title': 'Review'},
+            {'title': 'Done'},
+        ],
+    },
+]
+
+
+def create_templates(apps, schema_editor):
+    BoardTemplate = apps.get_model('api', 'BoardTemplate')
+    for template in TEMPLATES:
+        BoardTemplate.objects.get_or_create(name=template['name'], defaults=template)
+
+
+def delete_templates(apps, schema_editor):
+    BoardTemplate = apps.get_model('api', 'BoardTemplate')
+    BoardTemplate.objects.filter(name__in=[template['name'] for template in TEMPLATES]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.SlugField(unique=True)),
+                ('title', models.CharField(max_length=100)),
+                ('lists', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_templates, delete_templates),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.core.validators import MaxLengthValidator
+from api.ordering import next_position
 
 
 class Board(models.Model):
@@ -9,12 +11,11 @@ class Board(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     users = models.ManyToManyField(User)
+    # bumped on every write to the board, its lists or tasks made through the API, see api/cache.py
+    version = models.PositiveIntegerField(default=0)
 
     def get_next_position(self):
-        if not self.lists.exists():
-            return 0
-        else:
-            return self.lists.aggregate(models.Max('position'))['position__max'] + 1
+        return next_position(self.lists)
 
     def __str__(self):
         return self.title
@@ -27,14 +28,17 @@ class List(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     position = models.IntegerField(default=0)
 
+    class Meta:
+        ordering = ['position']
+        indexes = [
+            models.Index(fields=['board', 'position'], name='api_list_board_position_idx'),
+        ]
+
     def __str__(self):
         return f"({self.board.title}) {self.title}"
     
     def get_next_position(self):
-        if not self.tasks.exists():
-            return 0
-        else:
-            return self.tasks.aggregate(models.Max('position'))['position__max'] + 1
+        return next_position(self.tasks)
     
 class Task(models.Model):
     id = models.AutoField(primary_key=True)
@@ -45,5 +49,53 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     position = models.IntegerField(default=0)
 
+    class Meta:
+        ordering = ['position']
+        indexes = [
+            models.Index(fields=['list', 'position'], name='api_task_list_position_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class Tombstone(models.Model):
+    """A list or task deleted through the API, kept so clients syncing a board can drop it."""
+    LIST = 'list'
+    TASK = 'task'
+    KIND_CHOICES = [(LIST, 'List'), (TASK, 'Task')]
+
+    board = models.ForeignKey(Board, related_name="tombstones", on_delete=models.CASCADE)
+    kind = models.CharField(max_length=4, choices=KIND_CHOICES)
+    object_id = models.IntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'deleted_at'], name='api_tombstone_board_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
+
+
+class BoardTemplate(models.Model):
+    """
+    A named set of lists, with their seed tasks, new boards can be created from.
+
+    ``lists`` has the shape of the ``lists`` of a board import, see api/board_templates.py.
+    """
+    name = models.SlugField(max_length=50, unique=True)
+    title = models.CharField(max_length=100)
+    lists = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def clean(self):
+        from api.serializers import ImportListSerializer
+        serializer = ImportListSerializer(data=self.lists, many=True)
+        if not serializer.is_valid():
+            raise ValidationError({'lists': str(serializer.errors)})
+
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.name
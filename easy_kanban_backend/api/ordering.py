@@ -0,0 +1,173 @@
+"""
+Position handling for lists and tasks.
+
+The ``POSITION_ORDERING`` setting selects how positions are assigned:
+
+* ``dense``: positions are consecutive integers, so inserting or moving an
+  item shifts the siblings after it by one.
+* ``sparse``: positions are spaced ``POSITION_GAP`` apart, so inserting or
+  moving an item only writes the moved row. When there is no free key left
+  between two neighbours the siblings are shifted once and a rebalance that
+  spreads them out again is run in the background after the commit.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, Max, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+POSITION_GAP = 1024
+
+_rebalance_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='position-rebalance')
+
+
+def is_sparse():
+    return getattr(settings, 'POSITION_ORDERING', 'dense') == 'sparse'
+
+
+def position_step():
+    return POSITION_GAP if is_sparse() else 1
+
+
+def next_position(siblings):
+    """Return the position right after the last of ``siblings``."""
+    last_position = siblings.aggregate(Max('position'))['position__max']
+    return 0 if last_position is None else last_position + position_step()
+
+
+def next_position_expression(siblings):
+    """Expression evaluating to ``next_position(siblings)`` inside the statement that uses it."""
+    last_position = Subquery(siblings.order_by('-position').values('position')[:1])
+    return Coalesce(last_position + position_step(), 0)
+
+
+def append(serializer, parent, siblings, **kwargs):
+    """
+    Save the new item of ``serializer`` after the last of ``siblings`` and return it.
+
+    The position is allocated by a subquery inside the INSERT itself, so on SQLite it is computed under
+    the write lock of that single statement. Backends with row locks lock ``parent`` first, which
+    serializes concurrent appends to the same parent without touching anything else.
+    """
+    with transaction.atomic(using=siblings.db):
+        if connections[siblings.db].features.has_select_for_update:
+            list(type(parent).objects.select_for_update().filter(pk=parent.pk).values_list('pk'))
+        instance = serializer.save(position=next_position_expression(siblings), **kwargs)
+        instance.refresh_from_db(fields=['position'])
+    return instance
+
+
+def shift(siblings, position):
+    """Move every sibling at or after ``position`` one step down with a single UPDATE."""
+    return siblings.filter(position__gte=position).update(position=F('position') + 1, updated_at=timezone.now())
+
+
+def make_room(item, siblings, position):
+    """
+    Prepare the other ``siblings`` for ``item`` placed at ``position`` and return the position it should take.
+
+    ``siblings`` are all the items of the target parent. The item ends up before any sibling that currently
+    holds ``position``. In sparse mode nothing is written unless the gap in front of that sibling is exhausted.
+    """
+    others = siblings.exclude(pk=item.pk)
+    if not is_sparse():
+        shift(others, position)
+        return position
+    closest = list(others.filter(position__lte=position).order_by('-position').values_list('position', flat=True)[:2])
+    if not closest or closest[0] < position:
+        return position
+    if len(closest) == 1:
+        return position - POSITION_GAP
+    if position - closest[1] > 1:
+        return (closest[1] + position) // 2
+    shift(others, position)
+    schedule_rebalance(siblings)
+    return position
+
+
+def step_forward(item, siblings):
+    """Move ``item`` after its next sibling and return the position it should take."""
+    following = list(siblings.exclude(pk=item.pk).filter(position__gt=item.position).order_by('position').values_list('pk', 'position')[:2])
+    if not following:
+        return item.position
+    if is_sparse():
+        if len(following) == 1:
+            return following[0][1] + POSITION_GAP
+        if following[1][1] - following[0][1] > 1:
+            return (following[0][1] + following[1][1]) // 2
+    return _swap(item, siblings, *following[0])
+
+
+def step_backward(item, siblings):
+    """Move ``item`` before its previous sibling and return the position it should take."""
+    preceding = list(siblings.exclude(pk=item.pk).filter(position__lt=item.position).order_by('-position').values_list('pk', 'position')[:2])
+    if not preceding:
+        return item.position
+    if is_sparse():
+        if len(preceding) == 1:
+            return preceding[0][1] - POSITION_GAP
+        if preceding[0][1] - preceding[1][1] > 1:
+            return (preceding[1][1] + preceding[0][1]) // 2
+    return _swap(item, siblings, *preceding[0])
+
+
+def _swap(item, siblings, sibling_pk, sibling_position):
+    siblings.filter(pk=sibling_pk).update(position=item.position, updated_at=timezone.now())
+    return sibling_position
+
+
+def rebalance(siblings):
+    """
+    Spread ``siblings`` out evenly again, keeping their order.
+
+    The board version is bumped in the same transaction, so cached payloads and ETags of the board
+    go stale, and subscribers get a ``<model>.rebalanced`` event with the new positions.
+    """
+    # api.models imports this module
+    from api.cache import bump_board_version
+    from api.events import publish_board_event
+
+    step = position_step()
+    now = timezone.now()
+    with transaction.atomic():
+        items = list(siblings.select_for_update().order_by('position', 'pk'))
+        changed = []
+        for index, item in enumerate(items):
+            if item.position != index * step:
+                item.position = index * step
+                item.updated_at = now
+                changed.append(item)
+        siblings.model.objects.bulk_update(changed, ['position', 'updated_at'])
+        if changed:
+            board_id = _board_id(changed[0])
+            bump_board_version(board_id)
+            publish_board_event(board_id, f'{siblings.model._meta.model_name}.rebalanced',
+                                {'items': [{'id': item.pk, 'position': item.position} for item in changed]})
+    return len(changed)
+
+
+def _board_id(item):
+    # lists belong to a board directly, tasks through their list
+    if hasattr(item, 'board_id'):
+        return item.board_id
+    return type(item).list.field.related_model.objects.filter(pk=item.list_id).values_list('board_id', flat=True).get()
+
+
+def schedule_rebalance(siblings):
+    """Rebalance ``siblings`` in a background thread once the current transaction commits."""
+    siblings = siblings.all()
+    transaction.on_commit(lambda: _rebalance_executor.submit(_rebalance_in_background, siblings))
+
+
+def _rebalance_in_background(siblings):
+    try:
+        rebalance(siblings)
+    except Exception:
+        logger.exception('Rebalancing %s positions failed', siblings.model.__name__)
+    finally:
+        connections.close_all()
@@ -0,0 +1,31 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Keyset pagination that only applies when the client asks for it.
+
+    Requests with a ``cursor`` or ``page_size`` query parameter get a ``{next, previous, results}`` page
+    fetched with a ``WHERE position > ...`` seek on the composite indexes, which stays cheap however deep
+    the page is. Requests without them keep getting the plain, unpaginated list.
+    """
+    ordering = ('position', 'id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class BoardCursorPagination(OptInCursorPagination):
+    ordering = ('id',)
+
+
+class SearchPagination(PageNumberPagination):
+    """Numbered pages of ranked search results, which have no stable key to seek on."""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,54 @@
+import codecs
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from api.renderers import FastJSONRenderer, orjson
+
+
+def loads(data, encoding):
+    """Decode a JSON document from ``data`` bytes, with orjson when it is installed."""
+    if orjson is not None and codecs.lookup(encoding).name == 'utf-8':
+        return orjson.loads(data)
+    return json.loads(data.decode(encoding), parse_constant=json.strict_constant)
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser backed by orjson when it is installed, see api/renderers.py."""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return loads(stream.read(), encoding)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parse newline delimited JSON into an iterator of ``(line number, record)`` pairs.
+
+    The body is read line by line while the view consumes the iterator, so it never has to fit in
+    memory. Blank lines are skipped.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return self.records(stream, encoding)
+
+    def records(self, stream, encoding):
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, loads(line, encoding)
+            except ValueError as exc:
+                raise ParseError(f'NDJSON parse error on line {line_number} - {exc}')
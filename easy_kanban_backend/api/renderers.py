@@ -0,0 +1,38 @@
+"""
+JSON renderer backed by orjson when it is installed.
+
+FastJSONRenderer produces the same bytes as DRF's JSONRenderer with its default compact, unicode
+output: types orjson does not handle the same way (datetimes, decimals, lazy strings, ...) are passed
+to DRF's own JSONEncoder, and U+2028/U+2029 are escaped. Indented output, or non-default
+UNICODE_JSON/COMPACT_JSON/STRICT_JSON settings, are left to the stdlib renderer, as is everything
+when orjson is missing. Unlike the stdlib renderer, NaN and infinite floats render as null.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = JSONEncoder()
+
+
+def default(obj):
+    return _encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (orjson is None or self.ensure_ascii or not self.compact or not self.strict
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -0,0 +1,79 @@
+"""
+Full-text search over task titles and descriptions.
+
+The backend is chosen with the ``SEARCH_BACKEND`` setting (a dotted path), or from the database
+vendor when it is empty:
+
+* ``SQLiteFTSBackend`` matches against the ``api_task_fts`` FTS5 table created by migration 0011 and
+  ranks with bm25. Triggers keep the table in sync with api_task; a migration that makes Django remake
+  api_task on SQLite drops them and has to create them again.
+* ``PostgresSearchBackend`` matches and ranks with ``to_tsvector``/``ts_rank`` through django.contrib.postgres.
+* ``BasicSearchBackend`` falls back to case-insensitive containment, titles first.
+
+Backends take a Task queryset and the user's query and return the matching tasks, best first.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+
+class BasicSearchBackend:
+
+    def search(self, tasks, query):
+        matches = Q()
+        for term in query.split():
+            matches &= Q(title__icontains=term) | Q(description__icontains=term)
+        title_matches = Q(*(Q(title__icontains=term) for term in query.split()))
+        return tasks.filter(matches).annotate(
+            rank=Case(When(title_matches, then=Value(0)), default=Value(1), output_field=IntegerField()),
+        ).order_by('rank', 'id')
+
+
+class SQLiteFTSBackend:
+
+    def search(self, tasks, query):
+        match = self.match_expression(query)
+        # bm25 is lower for better matches, titles weigh more than descriptions
+        rank = RawSQL(
+            'SELECT bm25(api_task_fts, 10.0, 1.0) FROM api_task_fts WHERE api_task_fts MATCH %s AND rowid = api_task.id',
+            [match],
+        )
+        matching = RawSQL('SELECT rowid FROM api_task_fts WHERE api_task_fts MATCH %s', [match])
+        return tasks.filter(id__in=matching).annotate(rank=rank).order_by('rank', 'id')
+
+    @staticmethod
+    def match_expression(query):
+        """Turn free text into an FTS5 query matching every word as a prefix, with no operators."""
+        terms = ['"{}"*'.format(term.replace('"', '""')) for term in query.split()]
+        return ' '.join(terms)
+
+
+class PostgresSearchBackend:
+
+    def search(self, tasks, query):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+        # every word as a prefix, like SQLiteFTSBackend, with only word characters left of the input
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return tasks.none()
+        search_query = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw')
+        vector = SearchVector('title', weight='A') + SearchVector('description', weight='B')
+        return tasks.annotate(search=vector, rank=SearchRank(vector, search_query)).filter(search=search_query).order_by('-rank', 'id')
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteFTSBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend():
+    backend = getattr(settings, 'SEARCH_BACKEND', '')
+    if backend:
+        return import_string(backend)()
+    return VENDOR_BACKENDS.get(connection.vendor, BasicSearchBackend)()
@@ -1,63 +1,273 @@
+import logging
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from api.models import Board, Task, List
 from django.contrib.auth.password_validation import validate_password
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from api.board_templates import create_from_template, get_templates, instantiate
+from api.importing import BoardImporter
+from api.memberships import add_membership_claims
 
-class TaskSerializer(serializers.ModelSerializer):  
+logger = logging.getLogger(__name__)
+
+
+def nested_field_names(fields, name):
+    """The part of the ``fields`` selection that applies inside the ``name`` field, None for all of it."""
+    if fields is None or name in fields:
+        return None
+    return {field[len(name) + 1:] for field in fields if field.startswith(f'{name}.')}
+
+
+class SparseFieldsMixin:
+    """
+    Leave out fields the client did not ask for.
+
+    The ``fields`` context entry is a set of field names, with ``<field>.<name>`` selecting inside
+    nested lists and tasks, and ``depth`` limits how many levels of ``nested_fields`` are included.
+    Fields are removed before serialization, so their method fields and relations are never evaluated.
+    """
+    nested_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields, depth = self.context.get('fields'), self.context.get('depth')
+        selected = None if fields is None else {field.split('.', 1)[0] for field in fields}
+        for name in list(self.fields):
+            if (selected is not None and name not in selected) or (depth is not None and depth < 1 and name in self.nested_fields):
+                self.fields.pop(name)
+
+    def get_nested_context(self, name):
+        depth = self.context.get('depth')
+        return {
+            **self.context,
+            'fields': nested_field_names(self.context.get('fields'), name),
+            'depth': None if depth is None else depth - 1,
+        }
+
+
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = ['id', 'title', 'description', 'position']
 
-class TaskPatchSerializer(serializers.ModelSerializer):
+class TaskPatchSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = ['id', 'title', 'description', 'position', 'list']
 
 
-class ListSerializer(serializers.ModelSerializer):
+class TaskSearchSerializer(serializers.ModelSerializer):
+    board = serializers.IntegerField(source='list.board_id', read_only=True)
+
+    class Meta:
+        model = Task
+        fields = ['id', 'title', 'description', 'position', 'list', 'board']
+
+
+class TaskReorderSerializer(serializers.Serializer):
+    tasks = serializers.ListField(child=serializers.IntegerField())
+
+    def validate_tasks(self, value):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError("Task ids must be unique")
+        return value
+
+
+class ListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     tasks = serializers.SerializerMethodField()
+    nested_fields = ('tasks',)
 
     class Meta:
         model = List
         fields = ['id', 'title', 'tasks', 'position']
 
     def get_tasks(self, obj):
-        tasks = obj.tasks.all().order_by('position')
-        return TaskSerializer(tasks, many=True).data
+        # Task.Meta.ordering keeps this ordered and lets it use prefetched tasks
+        tasks = obj.tasks.all()
+        return TaskSerializer(tasks, many=True, context=self.get_nested_context('tasks')).data
+
+
+class ListBasicSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = List
+        fields = ['id', 'title', 'position']
+
 
+class BoardTemplateField(serializers.CharField):
+    """Name of the board template a new board is created from, see api/board_templates.py."""
+    default_error_messages = {'unknown': 'Unknown board template "{value}".'}
 
-class BoardBasicSerializer(serializers.ModelSerializer):
+    def __init__(self, **kwargs):
+        super().__init__(write_only=True, required=False, **kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if value not in get_templates():
+            self.fail('unknown', value=value)
+        return value
+
+
+def create_board(validated_data):
+    """Create a board, with the lists and tasks of its ``template`` when one is given."""
+    users = validated_data.pop('users')
+    template = validated_data.pop('template', None)
+    if template is None:
+        board = Board.objects.create(**validated_data)
+        board.users.set(users)
+        return board
+    with transaction.atomic():
+        return instantiate(template, [user.pk for user in users], validated_data['title'])
+
+
+class BoardBasicSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     users = serializers.PrimaryKeyRelatedField(
     queryset=User.objects.all(),
     many=True,
     )
+    template = BoardTemplateField()
+
     class Meta:
         model = Board
-        fields = ['id', 'title', 'users']
+        fields = ['id', 'title', 'users', 'template']
+
+    def create(self, validated_data):
+        return create_board(validated_data)
 
 
-class BoardSerializer(serializers.ModelSerializer):
+class ListSummarySerializer(serializers.ModelSerializer):
+    task_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = List
+        fields = ['id', 'title', 'position', 'task_count']
+
+
+class BoardSummarySerializer(BoardBasicSerializer):
+    # annotated by api.summaries, left out of responses to writes
+    list_count = serializers.IntegerField(read_only=True)
+    task_count = serializers.IntegerField(read_only=True)
+    last_activity = serializers.DateTimeField(read_only=True)
+    lists = ListSummarySerializer(many=True, read_only=True)
+    nested_fields = ('lists',)
+
+    class Meta(BoardBasicSerializer.Meta):
+        fields = BoardBasicSerializer.Meta.fields + ['list_count', 'task_count', 'last_activity', 'lists']
+
+
+class BoardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     users = serializers.PrimaryKeyRelatedField(
     queryset=User.objects.all(),
     many=True
     )
     lists = serializers.SerializerMethodField()
+    template = BoardTemplateField()
+    nested_fields = ('lists',)
 
     class Meta:
         model = Board
         fields = '__all__'
+        read_only_fields = ['version']
 
     def create(self, validated_data):
-        users = validated_data.pop('users')
-        board = Board.objects.create(**validated_data)
-        board.users.set(users)
-        return board
+        return create_board(validated_data)
+
+    def update(self, instance, validated_data):
+        # templates only apply to new boards
+        validated_data.pop('template', None)
+        return super().update(instance, validated_data)
     
     def get_lists(self, obj):
-        lists = obj.lists.all().order_by('position')
-        return ListSerializer(lists, many=True).data
+        # List.Meta.ordering keeps this ordered and lets it use prefetched lists
+        lists = obj.lists.all()
+        return ListSerializer(lists, many=True, context=self.get_nested_context('lists')).data
     
 
+class ImportTaskSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Task
+        fields = ['title', 'description', 'position']
+
+
+class ImportListSerializer(serializers.ModelSerializer):
+    tasks = ImportTaskSerializer(many=True, required=False)
+
+    class Meta:
+        model = List
+        fields = ['title', 'position', 'tasks']
+
+
+class ImportBoardSerializer(serializers.ModelSerializer):
+    lists = ImportListSerializer(many=True, required=False)
+
+    class Meta:
+        model = Board
+        fields = ['title', 'lists']
+
+
+class BoardImportSerializer(serializers.Serializer):
+    boards = ImportBoardSerializer(many=True, allow_empty=False)
+
+
+class BatchReferenceField(serializers.Field):
+    """The id of an existing list or task, or the ``ref`` given to one created earlier in the batch."""
+    default_error_messages = {'invalid': 'Must be an id or a ref string.'}
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool) or not isinstance(data, (int, str)):
+            self.fail('invalid')
+        return data
+
+    def to_representation(self, value):
+        return value
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=['create', 'update', 'move', 'delete'])
+    type = serializers.ChoiceField(choices=['list', 'task'])
+    id = BatchReferenceField(required=False)
+    list = BatchReferenceField(required=False)
+    position = serializers.IntegerField(required=False)
+    ref = serializers.CharField(required=False)
+    data = serializers.DictField(required=False, default=dict)
+
+    def validate(self, attrs):
+        if attrs['op'] != 'create' and 'id' not in attrs:
+            raise serializers.ValidationError({'id': 'This field is required.'})
+        if attrs['op'] == 'create' and attrs['type'] == 'task' and 'list' not in attrs:
+            raise serializers.ValidationError({'list': 'This field is required.'})
+        if attrs['op'] == 'move' and attrs['type'] == 'list' and 'position' not in attrs:
+            raise serializers.ValidationError({'position': 'This field is required.'})
+        return attrs
+
+
+class BoardBatchSerializer(serializers.Serializer):
+    operations = BatchOperationSerializer(many=True, allow_empty=False, max_length=500)
+
+
+def with_membership_claims(data):
+    """Replace the access token in the token endpoint ``data`` with one carrying membership claims."""
+    if settings.MEMBERSHIP_CLAIMS:
+        access = AccessToken(data['access'])
+        data['access'] = str(add_membership_claims(access, access[jwt_settings.USER_ID_CLAIM]))
+    return data
+
+
+class MembershipTokenObtainPairSerializer(TokenObtainPairSerializer):
+    def validate(self, attrs):
+        return with_membership_claims(super().validate(attrs))
+
+
+class MembershipTokenRefreshSerializer(TokenRefreshSerializer):
+    # claims are read again on every refresh instead of being copied from the refresh token
+    def validate(self, attrs):
+        return with_membership_claims(super().validate(attrs))
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
     password_confirm = serializers.CharField(write_only=True, required=True)
@@ -73,22 +283,36 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data.pop('password_confirm')
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            password=validated_data['password'],
-            email=validated_data.get('email', ''),
-            first_name=validated_data.get('first_name', ''),
-            last_name=validated_data.get('last_name', '')
-        )
-        #create Initial Boards and lists
-        create_initial_board(user, "My Board")
-        create_initial_board(user, "My Second Board")
+        password = validated_data.pop('password')
+        # RegisterView hashes the password off the event loop and passes the hash to save()
+        password_hash = validated_data.pop('password_hash', None) or make_password(password)
+        with transaction.atomic():
+            user = User(
+                username=User.normalize_username(validated_data['username']),
+                email=User.objects.normalize_email(validated_data.get('email', '')),
+                first_name=validated_data.get('first_name', ''),
+                last_name=validated_data.get('last_name', ''),
+                password=password_hash,
+            )
+            user.save()
+            create_initial_boards(user)
         return user
-    
-def create_initial_board(user, title):
-    initialBoard = Board.objects.create(title=title)
-    initialBoard.users.set([user])
-    List.objects.create(title="To Do", board=initialBoard)
-    List.objects.create(title="In Progress", board=initialBoard)
-    List.objects.create(title="Done", board=initialBoard)
-    return initialBoard
\ No newline at end of file
+
+
+# (template name, board title) of the boards every new user starts with
+INITIAL_BOARDS = [('kanban', 'My Board'), ('kanban', 'My Second Board')]
+# used when an initial board template has been renamed or deleted
+FALLBACK_LISTS = [{'title': 'To Do'}, {'title': 'In Progress'}, {'title': 'Done'}]
+
+
+def create_initial_boards(user):
+    """Create the boards of a new user, with one bulk INSERT per table."""
+    importer = BoardImporter([user.pk])
+    templates = get_templates()
+    for name, title in INITIAL_BOARDS:
+        if name in templates:
+            create_from_template(importer, name, title)
+        else:
+            logger.warning('Board template %r is missing, creating the initial board %r with the default lists', name, title)
+            importer.add_board({'title': title, 'lists': FALLBACK_LISTS})
+    return importer.finish()
@@ -0,0 +1,49 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from api.authentication import invalidate_user
+from api.board_templates import clear_templates
+from api.events import revoke_board_access
+from api.memberships import invalidate_memberships
+from api.models import Board, BoardTemplate
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(m2m_changed, sender=Board.users.through)
+def drop_changed_memberships(sender, instance, action, reverse, pk_set, **kwargs):
+    # joining a board needs no invalidation, boards missing from a claim are checked in the database
+    if action == 'pre_clear':
+        related = instance.board_set if reverse else instance.users
+        instance._cleared_pks = list(related.values_list('pk', flat=True))
+    elif action in ('post_clear', 'post_remove'):
+        pks = instance.__dict__.pop('_cleared_pks', []) if action == 'post_clear' else pk_set
+        if reverse:
+            invalidate_memberships([instance.pk])
+            for board_id in pks:
+                revoke_board_access(board_id, [instance.pk])
+        else:
+            invalidate_memberships(pks)
+            revoke_board_access(instance.pk, pks)
+
+
+@receiver(pre_delete, sender=Board)
+def collect_board_members(sender, instance, **kwargs):
+    instance._deleted_user_ids = list(instance.users.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Board)
+def drop_deleted_board_memberships(sender, instance, **kwargs):
+    invalidate_memberships(instance.__dict__.pop('_deleted_user_ids', []))
+    revoke_board_access(instance.pk)
+
+
+@receiver(post_save, sender=BoardTemplate)
+@receiver(post_delete, sender=BoardTemplate)
+def drop_cached_templates(sender, **kwargs):
+    clear_templates()
@@ -0,0 +1,45 @@
+"""
+Board summaries for the board picker.
+
+Counts and the last activity time are correlated subqueries annotated on the board queryset, so the
+whole listing stays a single query however many lists and tasks the boards hold.
+"""
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from api.models import List, Task, Tombstone
+
+
+def count_subquery(queryset, group_by):
+    counts = queryset.order_by().values(group_by).annotate(count=Count('pk')).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def latest_subquery(queryset, group_by, field):
+    latest = queryset.order_by().values(group_by).annotate(latest=Max(field)).values('latest')
+    return Coalesce(Subquery(latest), F('updated_at'))
+
+
+def annotate_summary(boards, list_count=True, task_count=True, last_activity=True):
+    """Annotate ``boards`` with the summary fields that are asked for."""
+    lists = List.objects.filter(board=OuterRef('pk'))
+    tasks = Task.objects.filter(list__board=OuterRef('pk'))
+    annotations = {}
+    if list_count:
+        annotations['list_count'] = count_subquery(lists, 'board')
+    if task_count:
+        annotations['task_count'] = count_subquery(tasks, 'list__board')
+    if last_activity:
+        # deletions count as activity too, and writes to lists and tasks do not touch the board row
+        annotations['last_activity'] = Greatest(
+            'updated_at',
+            latest_subquery(lists, 'board', 'updated_at'),
+            latest_subquery(tasks, 'list__board', 'updated_at'),
+            latest_subquery(Tombstone.objects.filter(board=OuterRef('pk')), 'board', 'deleted_at'),
+        )
+    return boards.annotate(**annotations)
+
+
+def lists_with_task_counts():
+    # Meta.ordering is not applied to aggregating queries
+    return List.objects.annotate(task_count=Count('tasks')).only('id', 'board', 'title', 'position').order_by('position')
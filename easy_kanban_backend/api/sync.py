@@ -0,0 +1,63 @@
+"""
+Changes made to a board since a cursor, for clients that poll instead of refetching the whole board.
+
+A cursor encodes the time of the previous sync and the board version seen
+then. Lists and tasks are returned when their ``updated_at`` is newer than
+the cursor and deletions come from tombstones. Every write made through the
+API bumps the board version, so a board whose version did not move since the
+cursor is answered without touching the List/Task tables at all.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.utils import timezone
+
+from api.models import List, Task
+from api.serializers import BoardBasicSerializer, ListBasicSerializer, TaskPatchSerializer
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# Rows are stamped before their transaction commits, so a sync may run between the two. Looking back a bit
+# further than the cursor returns such late commits next time at the cost of repeating recent changes.
+OVERLAP = timedelta(seconds=5)
+
+
+def make_cursor(moment, version):
+    return f'{(moment - EPOCH) // timedelta(microseconds=1)}.{version}'
+
+
+def parse_cursor(cursor):
+    """Return the ``(moment, version)`` encoded in ``cursor``, raising ValueError if it is malformed or OverflowError if it is out of range."""
+    microseconds, version = cursor.split('.')
+    return EPOCH + timedelta(microseconds=int(microseconds)), int(version)
+
+
+def get_board_changes(board, cursor=None):
+    """Return the lists, tasks and deletions of ``board`` newer than ``cursor``, or everything without one."""
+    # taken before reading so anything written meanwhile is returned again next time rather than missed
+    now = timezone.now()
+    changes = {
+        'cursor': make_cursor(now, board.version),
+        'board': None,
+        'lists': [],
+        'tasks': [],
+        'deleted': {'lists': [], 'tasks': []},
+    }
+    if cursor is not None and cursor[1] == board.version:
+        changes['cursor'] = make_cursor(cursor[0], board.version)
+        return changes
+
+    lists = List.objects.filter(board=board)
+    tasks = Task.objects.filter(list__board=board)
+    if cursor is None:
+        changes['board'] = BoardBasicSerializer(board).data
+    else:
+        since = cursor[0] - OVERLAP
+        if board.updated_at > since:
+            changes['board'] = BoardBasicSerializer(board).data
+        lists = lists.filter(updated_at__gt=since)
+        tasks = tasks.filter(updated_at__gt=since)
+        for kind, object_id in board.tombstones.filter(deleted_at__gt=since).values_list('kind', 'object_id'):
+            changes['deleted'][f'{kind}s'].append(object_id)
+    changes['lists'] = ListBasicSerializer(lists, many=True).data
+    changes['tasks'] = TaskPatchSerializer(tasks.order_by('list_id', 'position'), many=True).data
+    return changes
@@ -0,0 +1,135 @@
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import resolve, reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.async_views import AsyncBoardDetail, AsyncListList, AsyncTaskList
+from api.models import Board, List, Task
+from easy_kanban_backend.asgi import ReadViewsASGIHandler
+from rest_framework_simplejwt.tokens import RefreshToken
+
+ASYNC_URLCONF = 'easy_kanban_backend.async_urls'
+
+
+class AsyncReadViewsTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.other_user = User.objects.create_user(username='otheruser', password='testpassword')
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.other_user, self.user)
+        self.lists = [List.objects.create(title=f'List {i}', board=self.board, position=1 - i) for i in range(2)]
+        for j in range(3):
+            Task.objects.create(title=f'Task {j}', description=None if j % 2 else f'Description {j}', list=self.lists[0], position=2 - j)
+        self.another_user_board = Board.objects.create(title='Another Board')
+        self.another_user_board.users.add(self.other_user)
+        self.another_user_list = List.objects.create(title='Another List', board=self.another_user_board)
+        self.urls = {
+            'board': reverse('board-detail', kwargs={'board_pk': self.board.pk}),
+            'lists': reverse('list-list-create', kwargs={'board_pk': self.board.pk}),
+            'tasks': reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.lists[0].pk}),
+        }
+
+    def async_get(self, url, data=None, token=None, **headers):
+        if token is None:
+            token = self.token
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        with self.settings(ROOT_URLCONF=ASYNC_URLCONF):
+            return async_to_sync(self.async_client.get)(url, data, headers=headers)
+
+    def assertSameResponse(self, url, **kwargs):
+        expected = self.client.get(url, kwargs.get('data'))
+        response = self.async_get(url, **kwargs)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.json(), expected.json())
+        return response
+
+    def test_urls_resolve_to_the_async_views(self):
+        self.assertIs(resolve(self.urls['board'], ASYNC_URLCONF).func.view_class, AsyncBoardDetail)
+        self.assertIs(resolve(self.urls['lists'], ASYNC_URLCONF).func.view_class, AsyncListList)
+        self.assertIs(resolve(self.urls['tasks'], ASYNC_URLCONF).func.view_class, AsyncTaskList)
+
+    def test_reads_match_the_drf_views(self):
+        for url in self.urls.values():
+            with self.subTest(url=url):
+                response = self.assertSameResponse(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.async_get(self.urls['board'])['ETag'], self.client.get(self.urls['board'])['ETag'])
+
+    def test_board_is_rendered_after_a_write(self):
+        self.assertSameResponse(self.urls['board'])
+        self.client.post(self.urls['lists'], {'title': 'New List'}, format='json')
+        response = self.assertSameResponse(self.urls['board'])
+        self.assertEqual(len(response.json()['lists']), 3)
+
+    def test_unchanged_board_is_not_modified(self):
+        etag = self.async_get(self.urls['board'])['ETag']
+        response = self.async_get(self.urls['board'], **{'If-None-Match': etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_errors_match_the_drf_views(self):
+        cases = {
+            'not a member': reverse('list-list-create', kwargs={'board_pk': self.another_user_board.pk}),
+            'missing board': reverse('board-detail', kwargs={'board_pk': 9999}),
+            'list of another board': reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.another_user_list.pk}),
+        }
+        for name, url in cases.items():
+            with self.subTest(name):
+                self.assertSameResponse(url)
+
+    def test_authentication_errors_match_the_drf_views(self):
+        self.client.credentials()
+        response = self.assertSameResponse(self.urls['lists'], token='')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer realm="api"')
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid')
+        self.assertSameResponse(self.urls['lists'], token='invalid')
+
+    def test_query_parameters_are_handled_by_drf(self):
+        response = self.assertSameResponse(self.urls['board'], data={'fields': 'id,title'})
+        self.assertEqual(response.json(), {'id': self.board.pk, 'title': 'Test Board'})
+
+    def test_writes_are_handled_by_drf(self):
+        with self.settings(ROOT_URLCONF=ASYNC_URLCONF):
+            response = self.client.post(self.urls['lists'], {'title': 'New List'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.board.lists.count(), 3)
+
+    def test_writes_are_not_checked_for_a_csrf_token(self):
+        client = APIClient(enforce_csrf_checks=True)
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        with self.settings(ROOT_URLCONF=ASYNC_URLCONF):
+            response = client.post(self.urls['lists'], {'title': 'New List'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    @override_settings(MEMBERSHIP_CLAIMS=True)
+    def test_claimed_board_is_not_read(self):
+        tokens = self.client.post(reverse('token_obtain_pair'), {'username': 'testuser', 'password': 'testpassword'}, format='json').data
+        self.async_get(self.urls['tasks'], token=tokens['access'])
+        with self.assertNumQueries(2):
+            # the list check and the tasks
+            response = self.async_get(self.urls['tasks'], token=tokens['access'])
+        self.assertEqual(len(response.json()), 3)
+
+
+class ReadViewsASGIHandlerTestCase(SimpleTestCase):
+
+    def create_request(self):
+        scope = {'type': 'http', 'method': 'GET', 'path': '/api/board/1/', 'query_string': b'', 'headers': []}
+        request, _ = ReadViewsASGIHandler().create_request(scope, None)
+        return request
+
+    @override_settings(ASYNC_READ_VIEWS=True)
+    def test_async_read_views_are_routed_when_enabled(self):
+        self.assertEqual(self.create_request().urlconf, ASYNC_URLCONF)
+
+    def test_requests_use_the_root_urlconf_by_default(self):
+        self.assertFalse(hasattr(self.create_request(), 'urlconf'))
@@ -0,0 +1,74 @@
+import tempfile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.authentication import user_cache_key
+from api.models import Board
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class CachedJWTAuthenticationTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.url = reverse('board-detail', kwargs={'board_pk': self.board.pk})
+
+    def get_board(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_user_is_loaded_once(self):
+        response, queries = self.get_board()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len([sql for sql in queries if sql.startswith('SELECT') and 'FROM "auth_user" WHERE' in sql]), 1)
+        self.assertEqual(cache.get(user_cache_key(self.user.pk)).username, 'testuser')
+        response, queries = self.get_board()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([sql for sql in queries if 'FROM "auth_user" WHERE' in sql])
+
+    def test_saving_the_user_drops_the_cached_user(self):
+        self.get_board()
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        response, _ = self.get_board()
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleting_the_user_drops_the_cached_user(self):
+        self.get_board()
+        User.objects.filter(pk=self.user.pk).delete()
+        response, _ = self.get_board()
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_inactive_user_is_not_cached(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        response, _ = self.get_board()
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+
+class FileCacheAuthenticationTestCase(CachedJWTAuthenticationTestCase):
+    # a cache shared between processes, pickling the user instead of keeping the object
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': directory.name,
+        }})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        super().setUp()
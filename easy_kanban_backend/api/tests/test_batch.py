@@ -0,0 +1,99 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task, Tombstone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardBatchTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list1 = List.objects.create(title='List 1', board=self.board, position=0)
+        self.list2 = List.objects.create(title='List 2', board=self.board, position=1)
+        self.tasks = [Task.objects.create(title=f'Task {i}', list=self.list1, position=i) for i in range(3)]
+        self.url = reverse('board-batch', kwargs={'board_pk': self.board.pk})
+
+    def post(self, operations, **extra):
+        return self.client.post(self.url, {'operations': operations}, format='json', **extra)
+
+    def test_apply_operations_in_order(self):
+        response = self.post([
+            {'op': 'create', 'type': 'list', 'ref': 'new', 'data': {'title': 'List 3'}},
+            {'op': 'create', 'type': 'task', 'list': 'new', 'data': {'title': 'Task 3'}},
+            {'op': 'update', 'type': 'task', 'id': self.tasks[0].pk, 'data': {'title': 'Renamed Task'}},
+            {'op': 'move', 'type': 'task', 'id': self.tasks[2].pk, 'position': 0},
+            {'op': 'move', 'type': 'task', 'id': self.tasks[1].pk, 'list': self.list2.pk},
+            {'op': 'delete', 'type': 'list', 'id': self.list2.pk},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual([result['op'] for result in results], ['create', 'create', 'update', 'move', 'move', 'delete'])
+        new_list = List.objects.get(pk=results[0]['id'])
+        self.assertEqual(new_list.position, 2)
+        self.assertEqual(list(new_list.tasks.values_list('title', flat=True)), ['Task 3'])
+        self.assertEqual(list(self.list1.tasks.values_list('title', flat=True)), ['Task 2', 'Renamed Task'])
+        self.assertFalse(Task.objects.filter(pk=self.tasks[1].pk).exists())
+        self.assertTrue(Tombstone.objects.filter(kind=Tombstone.LIST, object_id=self.list2.pk).exists())
+
+    def test_batch_bumps_version_once(self):
+        response = self.post([
+            {'op': 'update', 'type': 'task', 'id': task.pk, 'data': {'title': 'Renamed'}} for task in self.tasks
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.version, 1)
+        detail = self.client.get(reverse('board-detail', kwargs={'board_pk': self.board.pk}))
+        self.assertEqual(response['ETag'], detail['ETag'])
+
+    def test_failing_operation_rolls_back_the_batch(self):
+        response = self.post([
+            {'op': 'update', 'type': 'task', 'id': self.tasks[0].pk, 'data': {'title': 'Renamed'}},
+            {'op': 'update', 'type': 'task', 'id': self.tasks[1].pk, 'data': {'title': ''}},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['index'], 1)
+        self.assertIn('title', response.data['errors'])
+        self.assertEqual(Task.objects.get(pk=self.tasks[0].pk).title, 'Task 0')
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.version, 0)
+
+    def test_items_of_other_boards_are_not_found(self):
+        other_board = Board.objects.create(title='Other Board')
+        other_list = List.objects.create(title='Other List', board=other_board)
+        response = self.post([{'op': 'move', 'type': 'task', 'id': self.tasks[0].pk, 'list': other_list.pk}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('list', response.data['errors'])
+        self.assertEqual(Task.objects.get(pk=self.tasks[0].pk).list_id, self.list1.pk)
+
+    def test_unknown_ref_is_not_an_id(self):
+        response = self.post([{'op': 'update', 'type': 'task', 'id': str(self.tasks[0].pk), 'data': {'title': 'Renamed'}}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['index'], 0)
+        self.assertIn('id', response.data['errors'])
+        self.assertEqual(Task.objects.get(pk=self.tasks[0].pk).title, 'Task 0')
+
+    def test_update_cannot_move(self):
+        response = self.post([{'op': 'update', 'type': 'task', 'id': self.tasks[0].pk, 'data': {'position': 2}}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_operation(self):
+        response = self.post([{'op': 'delete', 'type': 'task'}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stale_if_match_is_rejected(self):
+        response = self.post([{'op': 'delete', 'type': 'task', 'id': self.tasks[0].pk}], HTTP_IF_MATCH='"stale"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(Task.objects.filter(pk=self.tasks[0].pk).exists())
+
+    def test_non_member_cannot_batch(self):
+        self.board.users.remove(self.user)
+        response = self.post([{'op': 'delete', 'type': 'task', 'id': self.tasks[0].pk}])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
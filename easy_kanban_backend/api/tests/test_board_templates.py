@@ -0,0 +1,93 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.board_templates import clear_templates, get_templates, instantiate
+from api.models import Board, BoardTemplate, Task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardTemplateTestCase(TestCase):
+
+    def setUp(self):
+        clear_templates()
+        self.addCleanup(clear_templates)
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.url = reverse('board-list-create')
+
+    def create_board(self, template):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, {'title': 'New Board', 'users': [self.user.pk], 'template': template}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Board.objects.get(pk=response.data['id']), len(context.captured_queries)
+
+    def test_seeded_templates(self):
+        self.assertEqual(set(get_templates()), {'kanban', 'scrum'})
+        self.assertEqual([board_list['title'] for board_list in get_templates()['kanban']['lists']], ['To Do', 'In Progress', 'Done'])
+
+    def test_templates_are_loaded_once(self):
+        get_templates()
+        with self.assertNumQueries(0):
+            get_templates()
+
+    def test_saving_a_template_reloads_templates(self):
+        get_templates()
+        BoardTemplate.objects.create(name='empty', title='Empty Board', lists=[])
+        self.assertIn('empty', get_templates())
+
+    def test_create_board_from_template(self):
+        board, _ = self.create_board('scrum')
+        self.assertEqual(board.title, 'New Board')
+        self.assertEqual(list(board.users.all()), [self.user])
+        self.assertEqual(list(board.lists.values_list('title', 'position')),
+                         [('Backlog', 0), ('Sprint', 1), ('In Progress', 2), ('Review', 3), ('Done', 4)])
+        self.assertEqual(list(Task.objects.filter(list__board=board).values_list('list__title', 'title')),
+                         [('Backlog', 'Write the first user story'), ('Sprint', 'Plan the sprint')])
+
+    def test_query_count_does_not_depend_on_template_size(self):
+        lists = [{'title': f'List {i}', 'tasks': [{'title': f'Task {j}'} for j in range(5)]} for i in range(20)]
+        BoardTemplate.objects.create(name='large', title='Large Board', lists=lists)
+        BoardTemplate.objects.create(name='small', title='Small Board', lists=[{'title': 'List', 'tasks': [{'title': 'Task'}]}])
+        # loads the templates and caches the authenticated user
+        self.create_board('small')
+        large, large_queries = self.create_board('large')
+        small, small_queries = self.create_board('small')
+        self.assertEqual(Task.objects.filter(list__board=large).count(), 100)
+        self.assertEqual(large_queries, small_queries)
+
+    def test_unknown_template(self):
+        response = self.client.post(self.url, {'title': 'New Board', 'users': [self.user.pk], 'template': 'missing'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('template', response.data)
+        self.assertFalse(Board.objects.exists())
+
+    def test_instantiate_with_the_template_title(self):
+        board = instantiate('kanban', [self.user.pk])
+        self.assertEqual(board.title, 'My Board')
+        self.assertEqual(board.lists.count(), 3)
+
+    def test_invalid_template_lists(self):
+        template = BoardTemplate(name='broken', title='Broken', lists=[{'tasks': []}])
+        with self.assertRaises(ValidationError):
+            template.full_clean()
+
+    def test_invalid_template_is_left_out(self):
+        BoardTemplate.objects.create(name='untitled', title='Untitled', lists=[{'tasks': []}])
+        BoardTemplate.objects.create(name='long', title='Long', lists=[{'title': 'x' * 101}])
+        with self.assertLogs('api.board_templates', 'WARNING') as logs:
+            templates = get_templates()
+        self.assertEqual(len(logs.records), 2)
+        self.assertNotIn('untitled', templates)
+        self.assertNotIn('long', templates)
+        self.assertIn('kanban', templates)
+        response = self.client.post(self.url, {'title': 'New Board', 'users': [self.user.pk], 'template': 'untitled'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('template', response.data)
+        self.assertFalse(Board.objects.exists())
@@ -0,0 +1,171 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from api.cache import board_cache_key
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardCacheTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', list=self.list)
+        self.url = reverse('board-detail', kwargs={'board_pk': self.board.pk})
+
+    def get_board(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_unchanged_board_is_served_without_reading_lists_and_tasks(self):
+        first_response, _ = self.get_board()
+        response, queries = self.get_board()
+        self.assertEqual(response.data, first_response.data)
+        self.assertFalse([sql for sql in queries if '"api_list"' in sql or '"api_task"' in sql])
+
+    def test_task_create_is_visible_on_next_read(self):
+        self.get_board()
+        url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        self.client.post(url, {'title': 'New Task'}, format='json')
+        response, _ = self.get_board()
+        self.assertEqual([task['title'] for task in response.data['lists'][0]['tasks']], ['Test Task', 'New Task'])
+
+    def test_task_update_is_visible_on_next_read(self):
+        self.get_board()
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk})
+        self.client.patch(url, {'title': 'Patched Task'}, format='json')
+        response, _ = self.get_board()
+        self.assertEqual(response.data['lists'][0]['tasks'][0]['title'], 'Patched Task')
+
+    def test_list_delete_is_visible_on_next_read(self):
+        self.get_board()
+        url = reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        self.client.delete(url)
+        response, _ = self.get_board()
+        self.assertEqual(response.data['lists'], [])
+
+    def test_list_move_is_visible_on_next_read(self):
+        list2 = List.objects.create(title='Test List 2', board=self.board, position=1)
+        self.get_board()
+        self.client.patch(reverse('list-forward', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk}), format='json')
+        response, _ = self.get_board()
+        self.assertEqual([board_list['id'] for board_list in response.data['lists']], [list2.pk, self.list.pk])
+
+    def test_board_update_is_visible_on_next_read(self):
+        self.get_board()
+        self.client.patch(self.url, {'title': 'Patched Board'}, format='json')
+        response, _ = self.get_board()
+        self.assertEqual(response.data['title'], 'Patched Board')
+
+    def test_failed_write_does_not_bump_version(self):
+        url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        response = self.client.post(url, {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Board.objects.get(pk=self.board.pk).version, 0)
+
+    def test_version_is_read_only(self):
+        self.client.patch(self.url, {'version': 100}, format='json')
+        self.assertEqual(Board.objects.get(pk=self.board.pk).version, 1)
+
+    def test_cache_key_changes_with_version_and_board(self):
+        key = board_cache_key(self.board)
+        self.board.version += 1
+        self.assertNotEqual(board_cache_key(self.board), key)
+        recreated_board = Board.objects.create(title='Test Board')
+        recreated_board.pk = self.board.pk
+        self.assertNotEqual(board_cache_key(recreated_board), key)
+
+
+class ConditionalRequestTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', list=self.list)
+        self.board_url = reverse('board-detail', kwargs={'board_pk': self.board.pk})
+        self.list_url = reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        self.task_url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk})
+
+    def test_reads_carry_etags(self):
+        etags = {self.client.get(url)['ETag'] for url in (self.board_url, self.list_url, self.task_url)}
+        self.assertEqual(len(etags), 3)
+        for etag in etags:
+            self.assertTrue(etag.startswith('"'))
+
+    def test_conditional_get_returns_304_without_serialization(self):
+        for url in (self.board_url, self.list_url, self.task_url):
+            etag = self.client.get(url)['ETag']
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(response.content, b'')
+            # only authentication and permission checks, tasks are never loaded
+            self.assertFalse([query for query in context.captured_queries if 'FROM "api_task"' in query['sql']])
+
+    def test_conditional_get_after_write_returns_200(self):
+        etag = self.client.get(self.board_url)['ETag']
+        self.client.patch(self.task_url, {'title': 'Patched Task'}, format='json')
+        response = self.client.get(self.board_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_update_with_matching_if_match(self):
+        etag = self.client.get(self.task_url)['ETag']
+        response = self.client.patch(self.task_url, {'title': 'Patched Task'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).title, 'Patched Task')
+        self.assertEqual(response['ETag'], self.client.get(self.task_url)['ETag'])
+
+    def test_update_with_stale_if_match_is_rejected(self):
+        etag = self.client.get(self.task_url)['ETag']
+        self.client.patch(self.list_url, {'title': 'Patched List'}, format='json')
+        response = self.client.patch(self.task_url, {'title': 'Patched Task'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).title, 'Test Task')
+
+    def test_update_with_if_match_races_with_another_write(self):
+        etag = self.client.get(self.board_url)['ETag']
+        # another writer bumps the version after the ETag was checked against the loaded board
+        Board.objects.filter(pk=self.board.pk).update(version=5)
+        response = self.client.patch(self.board_url, {'title': 'Patched Board'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(Board.objects.get(pk=self.board.pk).title, 'Test Board')
+
+    def test_delete_with_stale_if_match_is_rejected(self):
+        response = self.client.delete(self.list_url, HTTP_IF_MATCH='"stale"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(List.objects.filter(pk=self.list.pk).exists())
+
+    def test_delete_board_with_matching_if_match(self):
+        etag = self.client.get(self.board_url)['ETag']
+        response = self.client.delete(self.board_url, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+
+    def test_list_move_accepts_list_etag(self):
+        List.objects.create(title='Test List 2', board=self.board, position=1)
+        etag = self.client.get(self.list_url)['ETag']
+        url = reverse('list-forward', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        response = self.client.patch(url, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,69 @@
+import importlib
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock, skipUnless
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.test import SimpleTestCase, TestCase
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite profile')
+class SQLiteProfileTest(TestCase):
+
+    def pragma(self, cursor, name):
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_on_connect(self):
+        with connection.cursor() as cursor:
+            self.assertEqual(self.pragma(cursor, 'synchronous'), 1)
+            self.assertEqual(self.pragma(cursor, 'busy_timeout'), 5000)
+
+    def test_file_database_uses_wal(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings_dict = {**connection.settings_dict, 'NAME': str(Path(directory) / 'profile.sqlite3')}
+            wrapper = SQLiteDatabaseWrapper(settings_dict, alias='profile')
+            try:
+                with wrapper.cursor() as cursor:
+                    self.assertEqual(self.pragma(cursor, 'journal_mode'), 'wal')
+                    self.assertEqual(self.pragma(cursor, 'mmap_size'), 134217728)
+            finally:
+                wrapper.close()
+
+    def test_transactions_take_the_write_lock_immediately(self):
+        self.assertEqual(connection.transaction_mode, 'IMMEDIATE')
+
+
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL profile')
+class PostgreSQLProfileTest(SimpleTestCase):
+
+    def test_connections_are_reused(self):
+        settings_dict = connection.settings_dict
+        self.assertTrue(settings_dict['CONN_HEALTH_CHECKS'])
+        if 'pool' in settings_dict['OPTIONS']:
+            self.assertEqual(settings_dict['CONN_MAX_AGE'], 0)
+            self.assertIsNotNone(connection.pool)
+
+
+class PostgreSQLSettingsTest(SimpleTestCase):
+
+    def load_settings(self, **environ):
+        module = importlib.import_module('easy_kanban_backend.settings')
+        with mock.patch.dict(os.environ, environ):
+            for name in ('DB_POOL', 'DB_CONN_MAX_AGE'):
+                if name not in environ:
+                    os.environ.pop(name, None)
+            database = importlib.reload(module).DATABASES['default']
+        importlib.reload(module)
+        return database
+
+    def test_pool_is_the_default(self):
+        database = self.load_settings(DB_ENGINE='postgresql')
+        self.assertIn('pool', database['OPTIONS'])
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+
+    def test_persistent_connections_without_the_pool(self):
+        database = self.load_settings(DB_ENGINE='postgresql', DB_POOL='False', DB_CONN_MAX_AGE='60')
+        self.assertNotIn('pool', database['OPTIONS'])
+        self.assertEqual(database['CONN_MAX_AGE'], 60)
@@ -0,0 +1,91 @@
+import json
+from io import StringIO
+from django.test import TestCase
+from django.urls import reverse
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.exporting import aiter_chunks, export_records
+from api.models import Board, List, Task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardExportTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list1 = List.objects.create(title='List 1', board=self.board, position=1)
+        self.list2 = List.objects.create(title='List 2', board=self.board, position=0)
+        self.task1 = Task.objects.create(title='Task 1', list=self.list1, position=1)
+        self.task2 = Task.objects.create(title='Task 2', list=self.list1, position=0)
+        self.other_board = Board.objects.create(title='Other Board')
+        List.objects.create(title='Other List', board=self.other_board)
+
+    def export(self):
+        response = self.client.get(reverse('board-export'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+    def test_export_streams_boards_lists_and_tasks_in_order(self):
+        records = self.export()
+        self.assertEqual([(record['type'], record['id']) for record in records], [
+            ('board', self.board.pk),
+            ('list', self.list2.pk),
+            ('list', self.list1.pk),
+            ('task', self.task2.pk),
+            ('task', self.task1.pk),
+        ])
+        self.assertEqual(records[3], {'type': 'task', 'id': self.task2.pk, 'list': self.list1.pk, 'title': 'Task 2',
+                                      'description': None, 'position': 0})
+
+    def test_export_query_count_does_not_grow_with_boards(self):
+        for i in range(5):
+            board = Board.objects.create(title=f'Board {i}')
+            board.users.add(self.user)
+            Task.objects.create(title='Task', list=List.objects.create(title='List', board=board))
+        with self.assertNumQueries(3):
+            records = list(export_records(Board.objects.filter(users=self.user)))
+        self.assertEqual(len(records), 5 + 5 * 3)
+
+    async def test_export_is_streamed_without_buffering_under_asgi(self):
+        response = await self.async_client.get(reverse('board-export'), headers={'Authorization': f'Bearer {self.token}'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual([json.loads(line)['type'] for line in body.splitlines()], ['board', 'list', 'list', 'task', 'task'])
+
+    async def test_chunks_are_pulled_one_at_a_time(self):
+        pulled = []
+
+        def lines():
+            for i in range(10):
+                pulled.append(i)
+                yield f'{i}\n'
+
+        chunks = aiter_chunks(lines(), chunk_size=3)
+        self.assertEqual(await anext(chunks), '0\n1\n2\n')
+        self.assertEqual(pulled, [0, 1, 2])
+        self.assertEqual([chunk async for chunk in chunks], ['3\n4\n5\n', '6\n7\n8\n', '9\n'])
+
+    def test_export_can_be_imported(self):
+        body = ''.join(json.dumps(record) + '\n' for record in self.export())
+        response = self.client.generic('POST', reverse('board-import'), body, content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        board = Board.objects.get(pk=response.data['boards'][0])
+        self.assertEqual(list(board.lists.values_list('title', flat=True)), ['List 2', 'List 1'])
+
+    def test_export_boards_command(self):
+        out = StringIO()
+        call_command('export_boards', user='testuser', stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(records), 5)
+        out = StringIO()
+        call_command('export_boards', stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 7)
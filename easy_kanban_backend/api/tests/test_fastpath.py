@@ -0,0 +1,97 @@
+import json
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.fastpath import TASK_PATCH_FIELDS, render_board, render_lists, render_tasks
+from api.models import Board, List, Task
+from api.serializers import BoardSerializer, ListSerializer, TaskPatchSerializer, TaskSerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class FastPathParityTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.other_user = User.objects.create_user(username='otheruser', password='testpassword')
+        self.board = Board.objects.create(title='Tëst Board  ')
+        self.board.users.add(self.other_user, self.user)
+        self.lists = [List.objects.create(title=f'List {i}', board=self.board, position=2 - i) for i in range(3)]
+        for task_list in self.lists[:2]:
+            for j in range(4):
+                Task.objects.create(title=f'Task {j}', description=None if j % 2 else f'Déscription "{j}"',
+                                    list=task_list, position=3 - j)
+        Board.objects.create(title='Other Board')
+
+    def test_board(self):
+        board = Board.objects.prefetch_related(Prefetch('users', queryset=User.objects.order_by('id')), 'lists__tasks').get(pk=self.board.pk)
+        self.assertEqual(render_board(self.board.pk), BoardSerializer(board).data)
+
+    def test_missing_board(self):
+        self.assertIsNone(render_board(0))
+
+    def test_lists(self):
+        lists = List.objects.filter(board=self.board)
+        self.assertEqual(render_lists(lists), ListSerializer(lists, many=True).data)
+        self.assertEqual(render_lists(List.objects.none()), [])
+
+    def test_tasks(self):
+        tasks = Task.objects.filter(list=self.lists[0])
+        self.assertEqual(render_tasks(tasks), TaskSerializer(tasks, many=True).data)
+        self.assertEqual(render_tasks(tasks, TASK_PATCH_FIELDS), TaskPatchSerializer(tasks, many=True).data)
+
+
+class FastPathViewsTest(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', description='Déscription', list=self.list)
+        List.objects.create(title='Empty List', board=self.board, position=1)
+
+    def assert_same_response(self, url):
+        responses = []
+        for fast in (False, True):
+            cache.clear()
+            with override_settings(FAST_READ_RENDERING=fast):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            responses.append(response)
+        self.assertEqual(responses[0].content, responses[1].content)
+        return json.loads(responses[1].content)
+
+    def test_endpoints_render_the_same_json(self):
+        self.assert_same_response(reverse('board-detail', kwargs={'board_pk': self.board.pk}))
+        self.assert_same_response(reverse('list-list-create', kwargs={'board_pk': self.board.pk}))
+        self.assert_same_response(reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk}))
+        self.assert_same_response(reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk}))
+        self.assert_same_response(reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk}))
+
+    @override_settings(FAST_READ_RENDERING=True)
+    def test_missing_objects_are_not_found(self):
+        response = self.client.get(reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': 0}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': 0}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(FAST_READ_RENDERING=True)
+    def test_sparse_and_paginated_requests_use_the_serializers(self):
+        url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        self.assertEqual(self.client.get(url, {'fields': 'id'}).data, [{'id': self.task.pk}])
+        self.assertEqual(len(self.client.get(url, {'page_size': 10}).data['results']), 1)
+
+    @override_settings(FAST_READ_RENDERING=True)
+    def test_fast_board_read_skips_model_instances(self):
+        cache.clear()
+        url = reverse('board-detail', kwargs={'board_pk': self.board.pk})
+        # authentication, membership, board, users, lists, tasks
+        with self.assertNumQueries(6):
+            self.client.get(url)
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class SparseFieldsTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', description='Long description', list=self.list)
+        self.board_url = reverse('board-detail', kwargs={'board_pk': self.board.pk})
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_board_depth_zero_skips_lists(self):
+        response, queries = self.get(self.board_url, depth=0)
+        self.assertNotIn('lists', response.data)
+        self.assertEqual(response.data['title'], 'Test Board')
+        self.assertFalse(any('FROM "api_list"' in sql for sql in queries))
+        self.assertFalse(any('FROM "api_task"' in sql for sql in queries))
+
+    def test_board_depth_one_skips_tasks(self):
+        response, queries = self.get(self.board_url, depth=1)
+        self.assertEqual(response.data['lists'], [{'id': self.list.pk, 'title': 'Test List', 'position': 0}])
+        self.assertFalse(any('FROM "api_task"' in sql for sql in queries))
+
+    def test_board_nested_fields(self):
+        response, queries = self.get(self.board_url, fields='title,lists.title,lists.tasks.title')
+        self.assertEqual(response.data, {'title': 'Test Board', 'lists': [{'title': 'Test List', 'tasks': [{'title': 'Test Task'}]}]})
+        task_query = next(sql for sql in queries if 'FROM "api_task"' in sql)
+        self.assertNotIn('"description"', task_query)
+        self.assertFalse(any('FROM "auth_user" INNER JOIN "api_board_users"' in sql for sql in queries))
+
+    def test_board_representations_are_cached_and_tagged_separately(self):
+        full, _ = self.get(self.board_url)
+        sparse, _ = self.get(self.board_url, fields='title')
+        self.assertEqual(sparse.data, {'title': 'Test Board'})
+        self.assertIn('lists', self.get(self.board_url)[0].data)
+        self.assertNotEqual(full['ETag'], sparse['ETag'])
+        response = self.client.get(self.board_url, {'fields': 'title'}, HTTP_IF_NONE_MATCH=sparse['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_endpoints(self):
+        url = reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        response, queries = self.get(url, depth=0)
+        self.assertNotIn('tasks', response.data)
+        self.assertFalse(any('FROM "api_task"' in sql for sql in queries))
+        response, _ = self.get(reverse('list-list-create', kwargs={'board_pk': self.board.pk}), fields='id,tasks.id')
+        self.assertEqual(response.data, [{'id': self.list.pk, 'tasks': [{'id': self.task.pk}]}])
+
+    def test_task_endpoints_load_only_requested_columns(self):
+        url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        response, queries = self.get(url, fields='id,title')
+        self.assertEqual(response.data, [{'id': self.task.pk, 'title': 'Test Task'}])
+        self.assertNotIn('"description"', next(sql for sql in queries if 'FROM "api_task"' in sql))
+
+    def test_board_list_fields(self):
+        response, queries = self.get(reverse('board-list-create'), fields='id,title')
+        self.assertEqual(response.data, [{'id': self.board.pk, 'title': 'Test Board'}])
+        self.assertFalse(any('FROM "auth_user" INNER JOIN "api_board_users"' in sql for sql in queries))
+
+    def test_fields_do_not_apply_to_writes(self):
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk})
+        response = self.client.patch(f'{url}?fields=id', {'title': 'Updated Task'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Updated Task')
+
+    def test_invalid_depth(self):
+        response = self.client.get(self.board_url, {'depth': 'deep'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,97 @@
+import json
+from django.test import TestCase
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardImportTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.url = reverse('board-import')
+
+    def post_ndjson(self, records):
+        body = '\n'.join(json.dumps(record) for record in records)
+        return self.client.generic('POST', self.url, body, content_type='application/x-ndjson')
+
+    def test_import_nested_document(self):
+        document = {'boards': [{'title': 'Imported Board', 'lists': [
+            {'title': 'To Do', 'tasks': [{'title': 'Task 1'}, {'title': 'Task 2', 'description': 'Details'}]},
+            {'title': 'Done', 'tasks': []},
+        ]}]}
+        response = self.client.post(self.url, document, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        board = Board.objects.get(pk=response.data['boards'][0])
+        self.assertEqual(list(board.users.all()), [self.user])
+        self.assertEqual(list(board.lists.values_list('pk', 'title', 'position')),
+                         [(response.data['lists'][0], 'To Do', 0), (response.data['lists'][1], 'Done', 1)])
+        self.assertEqual(list(Task.objects.filter(list__board=board).values_list('pk', 'title', 'description', 'position')),
+                         [(response.data['tasks'][0], 'Task 1', None, 0), (response.data['tasks'][1], 'Task 2', 'Details', 1)])
+
+    def test_import_writes_one_insert_per_model(self):
+        document = {'boards': [{'title': 'Imported Board', 'lists': [
+            {'title': f'List {i}', 'tasks': [{'title': f'Task {j}'} for j in range(20)]} for i in range(5)
+        ]}]}
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, document, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['tasks']), 100)
+        inserts = [query['sql'] for query in context.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 4)
+
+    def test_import_ndjson_records(self):
+        response = self.post_ndjson([
+            {'type': 'board', 'title': 'Board 1'},
+            {'type': 'list', 'title': 'List 1', 'position': 5},
+            {'type': 'task', 'title': 'Task 1'},
+            {'type': 'list', 'title': 'List 2'},
+            {'type': 'board', 'title': 'Board 2', 'lists': [{'title': 'List 3', 'tasks': [{'title': 'Task 2'}]}]},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['boards']), 2)
+        first, second = (Board.objects.get(pk=pk) for pk in response.data['boards'])
+        self.assertEqual(list(first.lists.values_list('title', 'position')), [('List 1', 5), ('List 2', 6)])
+        self.assertEqual(list(Task.objects.filter(list__board=second).values_list('title', flat=True)), ['Task 2'])
+
+    def test_invalid_record_rolls_back_the_import(self):
+        response = self.post_ndjson([
+            {'type': 'board', 'title': 'Board 1'},
+            {'type': 'list', 'title': 'List 1'},
+            {'type': 'task', 'title': 'x' * 101},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['line'], '3')
+        self.assertIn('title', response.data)
+        self.assertFalse(Board.objects.exists())
+        self.assertFalse(List.objects.exists())
+
+    def test_record_without_parent(self):
+        response = self.post_ndjson([{'type': 'task', 'title': 'Orphan Task'}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['line'], '1')
+
+    def test_malformed_ndjson(self):
+        response = self.client.generic('POST', self.url, '{"type": "board", "title": "Board 1"}\nnot json', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Board.objects.exists())
+
+    def test_json_body_that_is_not_an_object(self):
+        for body in ([{'type': 'board', 'title': 'Board 1'}], [], 'abc', 5):
+            with self.subTest(body=body):
+                response = self.client.post(self.url, body, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Board.objects.exists())
+
+    def test_import_requires_authentication(self):
+        self.client.credentials()
+        response = self.client.post(self.url, {'boards': [{'title': 'Board'}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,124 @@
+from unittest import mock
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.core.cache import cache
+from django.core.cache.backends.dummy import DummyCache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.checks import check_membership_claims_cache
+from api.memberships import membership_version_key
+from api.models import Board, List, Task
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+@override_settings(MEMBERSHIP_CLAIMS=True)
+class MembershipClaimsTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', list=self.list)
+        self.tokens = self.client.post(reverse('token_obtain_pair'), {'username': 'testuser', 'password': 'testpassword'}, format='json').data
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+        self.url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+
+    def get_tasks(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_access_token_carries_board_ids(self):
+        access = AccessToken(self.tokens['access'])
+        self.assertEqual(access['boards'], [self.board.pk])
+        self.assertIn('membership_version', access)
+
+    def test_member_is_authorized_without_reading_the_board(self):
+        response, queries = self.get_tasks()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['id'] for task in response.data], [self.task.pk])
+        self.assertFalse([sql for sql in queries if 'FROM "api_board"' in sql or '"api_board_users"' in sql])
+
+    def test_task_create_with_claims(self):
+        response = self.client.post(self.url, {'title': 'New Task'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Board.objects.get(pk=self.board.pk).version, 1)
+
+    def test_removed_member_falls_back_to_the_database(self):
+        self.board.users.remove(self.user)
+        response, queries = self.get_tasks()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue([sql for sql in queries if 'EXISTS' in sql])
+
+    def test_cleared_members_fall_back_to_the_database(self):
+        self.board.users.clear()
+        response, _ = self.get_tasks()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deleted_board_is_not_found(self):
+        Board.objects.filter(pk=self.board.pk).delete()
+        response, _ = self.get_tasks()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unclaimed_board_is_checked_in_the_database(self):
+        board = Board.objects.create(title='Joined Later')
+        board.users.add(self.user)
+        board_list = List.objects.create(title='Test List', board=board)
+        response = self.client.get(reverse('task-list-create', kwargs={'board_pk': board.pk, 'list_pk': board_list.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refresh_reads_the_claims_again(self):
+        board = Board.objects.create(title='Joined Later')
+        board.users.add(self.user)
+        self.board.users.remove(self.user)
+        response = self.client.post(reverse('token_refresh'), {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(AccessToken(response.data['access'])['boards'], [board.pk])
+
+    def test_claims_are_not_trusted_without_a_cached_version(self):
+        access = AccessToken(self.tokens['access'])
+        access['membership_version'] = None
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+        cache.delete(membership_version_key(self.user.pk))
+        self.board.users.remove(self.user)
+        response, _ = self.get_tasks()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_no_claims_without_a_cached_version(self):
+        with mock.patch('api.memberships.cache', DummyCache('', {})):
+            tokens = self.client.post(reverse('token_obtain_pair'), {'username': 'testuser', 'password': 'testpassword'}, format='json').data
+        access = AccessToken(tokens['access'])
+        self.assertNotIn('boards', access)
+        self.assertNotIn('membership_version', access)
+
+    @override_settings(MEMBERSHIP_CLAIMS=False)
+    def test_claims_are_ignored_when_disabled(self):
+        response, queries = self.get_tasks()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue([sql for sql in queries if 'EXISTS' in sql])
+        tokens = self.client.post(reverse('token_obtain_pair'), {'username': 'testuser', 'password': 'testpassword'}, format='json').data
+        self.assertNotIn('boards', AccessToken(tokens['access']))
+
+
+class MembershipClaimsCheckTestCase(SimpleTestCase):
+
+    @override_settings(MEMBERSHIP_CLAIMS=True)
+    def test_process_local_cache_is_refused(self):
+        self.assertEqual([error.id for error in check_membership_claims_cache(None)], ['api.E001'])
+
+    @override_settings(MEMBERSHIP_CLAIMS=True, CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_dummy_cache_is_refused(self):
+        self.assertEqual([error.id for error in check_membership_claims_cache(None)], ['api.E001'])
+
+    @override_settings(MEMBERSHIP_CLAIMS=True, CACHES={'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:6379'}})
+    def test_shared_cache_is_accepted(self):
+        self.assertEqual(check_membership_claims_cache(None), [])
+
+    def test_disabled_claims_accept_any_cache(self):
+        self.assertEqual(check_membership_claims_cache(None), [])
@@ -0,0 +1,237 @@
+from io import StringIO
+import sys
+from unittest import mock
+from threading import Barrier, Thread
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from api import ordering
+from api.ordering import POSITION_GAP, append, make_room, rebalance, step_backward, step_forward
+from api.serializers import TaskSerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class DenseOrderingTest(TestCase):
+    def setUp(self):
+        self.board = Board.objects.create(title='Test Board')
+        self.list = List.objects.create(title='Test List', board=self.board)
+
+    def test_make_room_shifts_following_tasks(self):
+        task = Task.objects.create(title='Moved Task', list=self.list, position=0)
+        task1 = Task.objects.create(title='Task 1', list=self.list, position=1)
+        task2 = Task.objects.create(title='Task 2', list=self.list, position=2)
+        self.assertEqual(make_room(task, self.list.tasks.all(), 1), 1)
+        self.assertEqual(Task.objects.get(pk=task1.pk).position, 2)
+        self.assertEqual(Task.objects.get(pk=task2.pk).position, 3)
+
+    def test_step_forward_swaps_with_next_list_across_a_gap(self):
+        list2 = List.objects.create(title='Test List 2', board=self.board, position=5)
+        self.assertEqual(step_forward(self.list, self.board.lists.all()), 5)
+        self.assertEqual(List.objects.get(pk=list2.pk).position, 0)
+
+    def test_step_backward_of_first_list_does_not_move(self):
+        List.objects.create(title='Test List 2', board=self.board, position=1)
+        self.assertEqual(step_backward(self.list, self.board.lists.all()), 0)
+
+
+class AppendTest(TestCase):
+    def setUp(self):
+        self.board = Board.objects.create(title='Test Board')
+        self.list = List.objects.create(title='Test List', board=self.board)
+
+    def test_append_after_last_task(self):
+        Task.objects.create(title='Task 1', list=self.list, position=4)
+        serializer = TaskSerializer(data={'title': 'New Task'})
+        serializer.is_valid(raise_exception=True)
+        task = append(serializer, self.list, self.list.tasks.all(), list=self.list)
+        self.assertEqual(task.position, 5)
+
+    def test_append_allocates_position_inside_the_insert(self):
+        serializer = TaskSerializer(data={'title': 'New Task'})
+        serializer.is_valid(raise_exception=True)
+        with CaptureQueriesContext(connection) as context:
+            task = append(serializer, self.list, self.list.tasks.all(), list=self.list)
+        self.assertEqual(task.position, 0)
+        # leaves out transaction control and the parent row lock taken on backends that support it
+        statements = [query['sql'] for query in context.captured_queries
+                      if not query['sql'].startswith(('SAVEPOINT', 'RELEASE')) and 'FOR UPDATE' not in query['sql']]
+        self.assertTrue(statements[0].startswith('INSERT'))
+        self.assertEqual(len([sql for sql in statements if sql.startswith('INSERT')]), 1)
+        self.assertFalse(any('MAX' in sql for sql in statements))
+
+
+class ConcurrentAppendTest(TransactionTestCase):
+    threads = 8
+    tasks_per_thread = 10
+
+    def test_concurrent_appends_do_not_duplicate_positions(self):
+        board = Board.objects.create(title='Test Board')
+        task_list = List.objects.create(title='Test List', board=board)
+        barrier = Barrier(self.threads)
+        errors = []
+
+        def create_tasks():
+            try:
+                barrier.wait()
+                for i in range(self.tasks_per_thread):
+                    while True:
+                        serializer = TaskSerializer(data={'title': f'Task {i}'})
+                        serializer.is_valid(raise_exception=True)
+                        try:
+                            append(serializer, task_list, Task.objects.filter(list=task_list), list=task_list)
+                            break
+                        except OperationalError:
+                            # the in-memory test database reports lock contention instead of waiting
+                            continue
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connections.close_all()
+
+        # switch threads as often as possible so allocations interleave
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            workers = [Thread(target=create_tasks) for _ in range(self.threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+        positions = list(Task.objects.filter(list=task_list).values_list('position', flat=True))
+        self.assertEqual(positions, list(range(self.threads * self.tasks_per_thread)))
+
+
+@override_settings(POSITION_ORDERING='sparse')
+class SparseOrderingTest(TestCase):
+    def setUp(self):
+        self.board = Board.objects.create(title='Test Board')
+        self.list = List.objects.create(title='Test List', board=self.board)
+
+    def create_tasks(self, *positions):
+        return [Task.objects.create(title=f'Task {i}', list=self.list, position=position) for i, position in enumerate(positions)]
+
+    def test_get_next_position_leaves_a_gap(self):
+        self.assertEqual(self.list.get_next_position(), 0)
+        self.create_tasks(0)
+        self.assertEqual(self.list.get_next_position(), POSITION_GAP)
+        self.assertEqual(self.board.get_next_position(), POSITION_GAP)
+
+    def test_make_room_on_free_position_writes_nothing(self):
+        task, _ = self.create_tasks(0, POSITION_GAP)
+        with self.assertNumQueries(1):
+            self.assertEqual(make_room(task, self.list.tasks.all(), 10), 10)
+
+    def test_make_room_before_occupied_position_takes_the_middle_of_the_gap(self):
+        task, first, second = self.create_tasks(3 * POSITION_GAP, 0, POSITION_GAP)
+        with self.assertNumQueries(1):
+            self.assertEqual(make_room(task, self.list.tasks.all(), POSITION_GAP), POSITION_GAP // 2)
+        self.assertEqual(Task.objects.get(pk=second.pk).position, POSITION_GAP)
+
+    def test_make_room_before_first_task(self):
+        task, first = self.create_tasks(POSITION_GAP, 0)
+        self.assertEqual(make_room(task, self.list.tasks.all(), 0), -POSITION_GAP)
+
+    def test_make_room_without_gap_shifts_and_schedules_rebalance(self):
+        task, first, second = self.create_tasks(10, 4, 5)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertEqual(make_room(task, self.list.tasks.all(), 5), 5)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(Task.objects.get(pk=first.pk).position, 4)
+        self.assertEqual(Task.objects.get(pk=second.pk).position, 6)
+
+    def test_step_forward_moves_between_next_two_lists(self):
+        list2 = List.objects.create(title='Test List 2', board=self.board, position=POSITION_GAP)
+        List.objects.create(title='Test List 3', board=self.board, position=2 * POSITION_GAP)
+        self.assertEqual(step_forward(self.list, self.board.lists.all()), POSITION_GAP + POSITION_GAP // 2)
+        self.assertEqual(List.objects.get(pk=list2.pk).position, POSITION_GAP)
+
+    def test_step_backward_moves_before_first_list(self):
+        list2 = List.objects.create(title='Test List 2', board=self.board, position=POSITION_GAP)
+        self.assertEqual(step_backward(list2, self.board.lists.all()), -POSITION_GAP)
+        self.assertEqual(List.objects.get(pk=self.list.pk).position, 0)
+
+    def test_rebalance_keeps_order(self):
+        tasks = self.create_tasks(7, 5, 6, -3)
+        self.assertEqual(rebalance(self.list.tasks.all()), 4)
+        self.assertEqual(list(self.list.tasks.values_list('pk', 'position')),
+                         [(tasks[3].pk, 0), (tasks[1].pk, POSITION_GAP), (tasks[2].pk, 2 * POSITION_GAP), (tasks[0].pk, 3 * POSITION_GAP)])
+
+    def test_rebalance_positions_command(self):
+        self.create_tasks(1, 2)
+        List.objects.create(title='Test List 2', board=self.board, position=1)
+        out = StringIO()
+        call_command('rebalance_positions', stdout=out)
+        self.assertIn('Rebalanced 3 positions', out.getvalue())
+        self.assertEqual(list(self.list.tasks.values_list('position', flat=True)), [0, POSITION_GAP])
+
+
+@override_settings(POSITION_ORDERING='sparse')
+class SparseOrderingViewsTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.tasks = [Task.objects.create(title=f'Task {i}', list=self.list, position=i * POSITION_GAP) for i in range(5)]
+
+    def test_move_task_writes_only_the_moved_row(self):
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.tasks[4].pk})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, {'position': POSITION_GAP}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['position'], POSITION_GAP // 2)
+        self.assertEqual(len([query for query in context.captured_queries if query['sql'].startswith('UPDATE "api_task"')]), 1)
+        self.assertEqual(list(self.list.tasks.values_list('pk', flat=True)),
+                         [self.tasks[0].pk, self.tasks[4].pk, self.tasks[1].pk, self.tasks[2].pk, self.tasks[3].pk])
+
+    def test_create_task_appends_after_gap(self):
+        url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        response = self.client.post(url, {'title': 'New Task'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['position'], 5 * POSITION_GAP)
+
+    def test_move_list_forward_writes_only_the_moved_row(self):
+        list2 = List.objects.create(title='Test List 2', board=self.board, position=POSITION_GAP)
+        url = reverse('list-forward', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len([query for query in context.captured_queries if query['sql'].startswith('UPDATE "api_list"')]), 1)
+        self.assertEqual(list(self.board.lists.values_list('pk', flat=True)), [list2.pk, self.list.pk])
+
+    def test_background_rebalance_invalidates_the_board_payload(self):
+        self.list.tasks.update(position=F('position') / POSITION_GAP)
+        board_url = reverse('board-detail', kwargs={'board_pk': self.board.pk})
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.tasks[4].pk})
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.patch(url, {'position': 1}, format='json')
+        before = self.client.get(board_url)
+        self.assertEqual([task['position'] for task in before.data['lists'][0]['tasks']], [0, 1, 2, 3, 4])
+        with mock.patch.object(ordering._rebalance_executor, 'submit', lambda function, siblings: rebalance(siblings)):
+            for callback in callbacks:
+                callback()
+        after = self.client.get(board_url, HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(after['ETag'], before['ETag'])
+        self.assertEqual([task['position'] for task in after.data['lists'][0]['tasks']], [i * POSITION_GAP for i in range(5)])
+
+    def test_reorder_tasks_spaces_positions(self):
+        url = reverse('task-reorder', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        task_ids = [task.pk for task in reversed(self.tasks)]
+        response = self.client.put(url, {'tasks': task_ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['position'] for task in response.data], [i * POSITION_GAP for i in range(5)])
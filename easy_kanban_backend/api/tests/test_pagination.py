@@ -0,0 +1,65 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class CursorPaginationTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        # reversed creation order so that position and id disagree
+        self.tasks = [Task.objects.create(title=f'Task {i}', list=self.list, position=24 - i) for i in range(25)][::-1]
+        self.url = reverse('task-list-create', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 25)
+
+    def test_walk_pages_in_position_order(self):
+        titles = []
+        url = f'{self.url}?page_size=10'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 10)
+            titles += [task['title'] for task in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(titles, [task.title for task in self.tasks])
+
+    def test_page_seeks_instead_of_offset(self):
+        response = self.client.get(f'{self.url}?page_size=10')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(response.data['next'])
+        self.assertEqual([task['position'] for task in response.data['results']], list(range(10, 20)))
+        sql = next(query['sql'] for query in context.captured_queries if 'FROM "api_task"' in query['sql'])
+        self.assertIn('"api_task"."position" > 9', sql)
+        self.assertNotIn('OFFSET', sql)
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(f'{self.url}?page_size=5000')
+        self.assertEqual(len(response.data['results']), 25)
+        self.assertIsNone(response.data['next'])
+
+    def test_lists_and_boards_are_paginated(self):
+        List.objects.create(title='Test List 2', board=self.board, position=1)
+        response = self.client.get(reverse('list-list-create', kwargs={'board_pk': self.board.pk}), {'page_size': 1})
+        self.assertEqual([item['title'] for item in response.data['results']], ['Test List'])
+        self.assertEqual(len(response.data['results'][0]['tasks']), 25)
+        response = self.client.get(response.data['next'])
+        self.assertEqual([item['title'] for item in response.data['results']], ['Test List 2'])
+        response = self.client.get(reverse('board-list-create'), {'page_size': 1})
+        self.assertEqual([board['id'] for board in response.data['results']], [self.board.pk])
@@ -0,0 +1,115 @@
+from unittest import mock
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.consumers import CLOSE_REVOKED, CLOSE_TOKEN_EXPIRED
+from api.models import Board, List, Task
+from easy_kanban_backend.asgi import application
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardConsumerTestCase(TransactionTestCase):
+    # consumers close old database connections, which would end the transaction of a TestCase
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', list=self.list)
+
+    def communicator(self, board_pk=None, token=None):
+        path = f'/ws/board/{board_pk or self.board.pk}/?token={token or self.token}'
+        return WebsocketCommunicator(application, path, headers=[(b'origin', b'http://127.0.0.1:5173')])
+
+    def write(self, method, url, data=None):
+        return getattr(self.client, method)(url, data, format='json')
+
+    async def test_member_receives_task_update(self):
+        communicator = self.communicator()
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk})
+        response = await sync_to_async(self.write)('patch', url, {'title': 'Updated Task'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        message = await communicator.receive_json_from()
+        self.assertEqual(message['event'], 'task.updated')
+        self.assertEqual(message['data']['title'], 'Updated Task')
+        await communicator.disconnect()
+
+    async def test_member_receives_list_create_and_delete(self):
+        communicator = self.communicator()
+        await communicator.connect()
+        url = reverse('list-list-create', kwargs={'board_pk': self.board.pk})
+        response = await sync_to_async(self.write)('post', url, {'title': 'New List'})
+        message = await communicator.receive_json_from()
+        self.assertEqual(message, {'event': 'list.created', 'data': response.data})
+        url = reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': response.data['id']})
+        await sync_to_async(self.write)('delete', url)
+        message = await communicator.receive_json_from()
+        self.assertEqual(message, {'event': 'list.deleted', 'data': {'id': response.data['id']}})
+        await communicator.disconnect()
+
+    async def test_failed_write_is_not_published(self):
+        communicator = self.communicator()
+        await communicator.connect()
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk})
+        response = await sync_to_async(self.write)('patch', url, {'title': ''})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
+    async def test_removed_member_is_disconnected(self):
+        other_user = await sync_to_async(User.objects.create_user)(username='otheruser', password='testpassword')
+        await self.board.users.aadd(other_user)
+        communicator = self.communicator()
+        other_communicator = self.communicator(token=str(RefreshToken.for_user(other_user).access_token))
+        await communicator.connect()
+        await other_communicator.connect()
+        await self.board.users.aremove(self.user)
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': CLOSE_REVOKED})
+        self.assertTrue(await other_communicator.receive_nothing())
+        await other_communicator.disconnect()
+
+    async def test_member_removed_from_their_side_is_disconnected(self):
+        communicator = self.communicator()
+        await communicator.connect()
+        await self.user.board_set.aclear()
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': CLOSE_REVOKED})
+
+    async def test_deleted_board_disconnects_its_members(self):
+        communicator = self.communicator()
+        await communicator.connect()
+        await sync_to_async(self.board.delete)()
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': CLOSE_REVOKED})
+
+    async def test_expired_token_is_disconnected(self):
+        communicator = self.communicator()
+        await communicator.connect()
+        url = reverse('list-list-create', kwargs={'board_pk': self.board.pk})
+        with mock.patch('api.consumers.time') as time:
+            time.time.return_value = float('inf')
+            await sync_to_async(self.write)('post', url, {'title': 'New List'})
+            self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': CLOSE_TOKEN_EXPIRED})
+
+    async def test_invalid_token_is_rejected(self):
+        connected, _ = await self.communicator(token='invalid').connect()
+        self.assertFalse(connected)
+
+    async def test_non_member_is_rejected(self):
+        other_board = await Board.objects.acreate(title='Other Board')
+        connected, _ = await self.communicator(board_pk=other_board.pk).connect()
+        self.assertFalse(connected)
+
+    async def test_foreign_origin_is_rejected(self):
+        communicator = WebsocketCommunicator(application, f'/ws/board/{self.board.pk}/?token={self.token}',
+                                             headers=[(b'origin', b'http://evil.example')])
+        connected, _ = await communicator.connect()
+        self.assertFalse(connected)
@@ -0,0 +1,79 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.board_templates import clear_templates
+from api.models import Board, BoardTemplate
+
+
+class RegisterViewTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('auth_register')
+        self.data = {
+            'username': 'newuser',
+            'password': 'Str0ng-Passw0rd',
+            'password_confirm': 'Str0ng-Passw0rd',
+            'email': 'newuser@EXAMPLE.com',
+        }
+
+    def test_register_creates_user_with_initial_boards(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json(), {'username': 'newuser', 'email': 'newuser@example.com', 'first_name': '', 'last_name': ''})
+        user = User.objects.get(username='newuser')
+        self.assertTrue(user.check_password('Str0ng-Passw0rd'))
+        boards = Board.objects.filter(users=user).order_by('id')
+        self.assertEqual([board.title for board in boards], ['My Board', 'My Second Board'])
+        for board in boards:
+            self.assertEqual(list(board.lists.values_list('title', 'position')), [('To Do', 0), ('In Progress', 1), ('Done', 2)])
+        # user, boards, memberships and lists are one INSERT each
+        self.assertEqual(len([query for query in context.captured_queries if query['sql'].startswith('INSERT')]), 4)
+
+    def test_register_without_the_initial_board_template(self):
+        BoardTemplate.objects.filter(name='kanban').delete()
+        self.addCleanup(clear_templates)
+        with self.assertLogs('api.serializers', 'WARNING'):
+            response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        boards = Board.objects.filter(users__username='newuser').order_by('id')
+        self.assertEqual([board.title for board in boards], ['My Board', 'My Second Board'])
+        for board in boards:
+            self.assertEqual(list(board.lists.values_list('title', flat=True)), ['To Do', 'In Progress', 'Done'])
+
+    def test_register_with_form_data(self):
+        response = self.client.post(self.url, self.data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.filter(username='newuser').exists())
+
+    def test_registered_user_can_obtain_a_token(self):
+        self.client.post(self.url, self.data, format='json')
+        response = self.client.post(reverse('token_obtain_pair'), {'username': 'newuser', 'password': 'Str0ng-Passw0rd'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_register_passwords_not_matching(self):
+        self.data['password_confirm'] = 'Other-Passw0rd'
+        response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', response.json())
+        self.assertFalse(User.objects.exists())
+
+    def test_register_taken_username(self):
+        User.objects.create_user(username='newuser', password='testpassword')
+        response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('username', response.json())
+
+    def test_register_invalid_json(self):
+        response = self.client.post(self.url, '{"username":', content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_register_from_async_client(self):
+        response = await self.async_client.post(self.url, self.data, content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(await Board.objects.filter(users__username='newuser').acount(), 2)
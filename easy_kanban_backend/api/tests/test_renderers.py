@@ -0,0 +1,99 @@
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+from uuid import UUID
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+SAMPLE = {
+    'id': 1,
+    'title': 'Zażółć \u2028 line \u2029 separator "quoted" \\ \U0001F600',
+    'created_at': datetime(2024, 5, 1, 12, 30, 45, 123456, tzinfo=dt_timezone.utc),
+    'updated_at': datetime(2024, 5, 1, 12, 30, 45, tzinfo=dt_timezone(timedelta(hours=2))),
+    'naive': datetime(2024, 5, 1, 12, 30),
+    'day': date(2024, 5, 1),
+    'at': time(8, 15, 30, 250000),
+    'duration': timedelta(minutes=90),
+    'price': Decimal('12.50'),
+    'label': gettext_lazy('Lazy label'),
+    'uuid': UUID('12345678-1234-5678-1234-567812345678'),
+    'ratio': 0.1,
+    'big': 2 ** 70,
+    7: 'int key',
+    'nested': [{'description': None, 'flag': True}, []],
+}
+
+
+class FastJSONRendererTest(SimpleTestCase):
+
+    def test_same_bytes_as_drf_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(SAMPLE), JSONRenderer().render(SAMPLE))
+
+    def test_same_bytes_without_fallback_types(self):
+        data = {key: value for key, value in SAMPLE.items() if key != 'big'}
+        expected = JSONRenderer().render(data)
+        with mock.patch.object(JSONRenderer, 'render', side_effect=AssertionError('fell back to stdlib')):
+            self.assertEqual(FastJSONRenderer().render(data), expected)
+
+    def test_indent_uses_stdlib(self):
+        rendered = FastJSONRenderer().render({'a': [1]}, 'application/json; indent=4')
+        self.assertEqual(rendered, b'{\n    "a": [\n        1\n    ]\n}')
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_without_orjson(self):
+        with mock.patch('api.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render(SAMPLE), JSONRenderer().render(SAMPLE))
+
+
+class FastJSONParserTest(SimpleTestCase):
+
+    def parse(self, body, parser=None):
+        return (parser or FastJSONParser()).parse(BytesIO(body))
+
+    def test_same_data_as_drf_parser(self):
+        body = '{"title": "Zażółć \\u2028", "n": [1, 2.5, null, true], "nested": {"a": "b"}}'.encode()
+        self.assertEqual(self.parse(body), self.parse(body, JSONParser()))
+
+    def test_invalid_json(self):
+        for body in (b'{"title": ', b'{"n": NaN}', b'\xff'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(body)
+
+    def test_without_orjson(self):
+        with mock.patch('api.parsers.orjson', None):
+            self.assertEqual(self.parse(b'{"a": 1}'), {'a': 1})
+
+
+class FastJSONViewsTest(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        Task.objects.create(title='Zadanie \u2028', list=List.objects.create(title='Lista', board=self.board))
+
+    def test_board_detail_renders_like_drf(self):
+        response = self.client.get(reverse('board-detail', kwargs={'board_pk': self.board.pk}))
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_requests_are_parsed(self):
+        url = reverse('list-list-create', kwargs={'board_pk': self.board.pk})
+        response = self.client.post(url, '{"title": "Nowa lista"}', content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['title'], 'Nowa lista')
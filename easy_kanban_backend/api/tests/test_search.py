@@ -0,0 +1,71 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from api.search import SQLiteFTSBackend
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class TaskSearchTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.title_match = Task.objects.create(title='Deploy the release', list=self.list, position=0)
+        self.description_match = Task.objects.create(title='Write notes', description='Describe the release process', list=self.list, position=1)
+        Task.objects.create(title='Unrelated', list=self.list, position=2)
+        other_board = Board.objects.create(title='Other Board')
+        Task.objects.create(title='Foreign release', list=List.objects.create(title='Other List', board=other_board))
+        self.url = reverse('task-search')
+
+    def search(self, q, **params):
+        response = self.client.get(self.url, {'q': q, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_search_ranks_title_matches_first(self):
+        response = self.search('release')
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual([task['id'] for task in response.data['results']], [self.title_match.pk, self.description_match.pk])
+        self.assertEqual(response.data['results'][0]['board'], self.board.pk)
+
+    def test_search_matches_prefixes_and_all_words(self):
+        self.assertEqual([task['id'] for task in self.search('rel proc').data['results']], [self.description_match.pk])
+
+    def test_index_follows_writes(self):
+        self.title_match.title = 'Ship it'
+        self.title_match.save()
+        self.description_match.delete()
+        self.assertEqual(self.search('release').data['count'], 0)
+        Task.objects.bulk_create([Task(title='Release party', list=self.list)])
+        self.assertEqual(self.search('release').data['count'], 1)
+
+    def test_operators_in_query_are_searched_as_text(self):
+        self.assertEqual(self.search('release" OR "unrelated').data['count'], 0)
+        self.assertEqual(self.search('NEAR( *').data['count'], 0)
+
+    def test_search_is_paginated(self):
+        Task.objects.bulk_create([Task(title=f'Release {i}', list=self.list, position=3 + i) for i in range(5)])
+        response = self.search('release', page_size=3)
+        self.assertEqual(response.data['count'], 7)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_query_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(SEARCH_BACKEND='api.search.BasicSearchBackend')
+    def test_basic_backend(self):
+        response = self.search('release')
+        self.assertEqual([task['id'] for task in response.data['results']], [self.title_match.pk, self.description_match.pk])
+
+    def test_match_expression_quotes_terms(self):
+        self.assertEqual(SQLiteFTSBackend.match_expression('a "b'), '"a"* """b"*')
@@ -0,0 +1,62 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BoardSummaryTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list1 = List.objects.create(title='List 1', board=self.board, position=0)
+        self.list2 = List.objects.create(title='List 2', board=self.board, position=1)
+        for i in range(3):
+            Task.objects.create(title=f'Task {i}', list=self.list1, position=i)
+        self.empty_board = Board.objects.create(title='Empty Board')
+        self.empty_board.users.add(self.user)
+        self.url = reverse('board-list-create')
+
+    def test_board_list_has_counts_and_last_activity(self):
+        later = timezone.now() + timedelta(hours=1)
+        Task.objects.filter(list=self.list1, position=2).update(updated_at=later)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        summaries = {board['id']: board for board in response.data}
+        self.assertEqual((summaries[self.board.pk]['list_count'], summaries[self.board.pk]['task_count']), (2, 3))
+        self.assertEqual((summaries[self.empty_board.pk]['list_count'], summaries[self.empty_board.pk]['task_count']), (0, 0))
+        self.assertEqual(summaries[self.board.pk]['last_activity'], later.isoformat().replace('+00:00', 'Z'))
+        self.assertIsNotNone(summaries[self.empty_board.pk]['last_activity'])
+        self.assertNotIn('lists', summaries[self.board.pk])
+
+    def test_summaries_are_computed_in_the_board_query(self):
+        # authentication, boards with their summaries, board users
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+        # the authenticated user is cached from now on
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'fields': 'id,title,task_count'})
+        self.assertEqual(response.data[0], {'id': self.board.pk, 'title': 'Test Board', 'task_count': 3})
+
+    def test_per_list_counts_with_depth(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'depth': 1})
+        board = next(board for board in response.data if board['id'] == self.board.pk)
+        self.assertEqual(board['lists'], [
+            {'id': self.list1.pk, 'title': 'List 1', 'position': 0, 'task_count': 3},
+            {'id': self.list2.pk, 'title': 'List 2', 'position': 1, 'task_count': 0},
+        ])
+
+    def test_create_response_has_no_summary(self):
+        response = self.client.post(self.url, {'title': 'New Board', 'users': [self.user.pk]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(set(response.data), {'id', 'title', 'users'})
@@ -0,0 +1,127 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from api.models import Board, List, Task, Tombstone
+from api.sync import OVERLAP, make_cursor, parse_cursor
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class CursorTest(TestCase):
+
+    def test_cursor_round_trip(self):
+        board = Board.objects.create(title='Test Board')
+        self.assertEqual(parse_cursor(make_cursor(board.created_at, 3)), (board.created_at, 3))
+
+    def test_malformed_cursor(self):
+        with self.assertRaises(ValueError):
+            parse_cursor('yesterday')
+
+    def test_out_of_range_cursor(self):
+        with self.assertRaises(OverflowError):
+            parse_cursor('99999999999999999999999.1')
+
+
+class BoardChangesTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.task = Task.objects.create(title='Test Task', list=self.list)
+        self.url = reverse('board-changes', kwargs={'board_pk': self.board.pk})
+        self.another_user = User.objects.create_user(username='anotheruser', password='anotherpassword')
+        self.another_user_board = Board.objects.create(title='Another User Board')
+        self.another_user_board.users.add(self.another_user)
+
+    def sync(self, cursor=None):
+        response = self.client.get(self.url, {'since': cursor} if cursor else {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def age_board(self):
+        # move existing rows out of the overlap window so only new changes show up
+        past = self.board.created_at - OVERLAP * 2
+        List.objects.filter(board=self.board).update(updated_at=past)
+        Task.objects.filter(list__board=self.board).update(updated_at=past)
+        Board.objects.filter(pk=self.board.pk).update(updated_at=past)
+        Tombstone.objects.filter(board=self.board).update(deleted_at=past)
+
+    def test_initial_sync_returns_everything(self):
+        changes = self.sync()
+        self.assertEqual(changes['board']['title'], 'Test Board')
+        self.assertEqual([board_list['id'] for board_list in changes['lists']], [self.list.pk])
+        self.assertEqual([task['id'] for task in changes['tasks']], [self.task.pk])
+        self.assertIn('cursor', changes)
+
+    def test_idle_board_returns_nothing_without_reading_lists_and_tasks(self):
+        cursor = self.sync()['cursor']
+        with CaptureQueriesContext(connection) as context:
+            changes = self.sync(cursor)
+        self.assertEqual(changes['lists'], [])
+        self.assertEqual(changes['tasks'], [])
+        self.assertIsNone(changes['board'])
+        self.assertEqual(changes['cursor'], cursor)
+        self.assertFalse([query for query in context.captured_queries if '"api_list"' in query['sql'] or '"api_task"' in query['sql']])
+
+    def test_updated_task_is_returned(self):
+        cursor = self.sync()['cursor']
+        self.age_board()
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk})
+        self.client.patch(url, {'title': 'Patched Task'}, format='json')
+        changes = self.sync(cursor)
+        self.assertEqual([task['title'] for task in changes['tasks']], ['Patched Task'])
+        self.assertEqual(changes['lists'], [])
+        self.assertNotEqual(changes['cursor'], cursor)
+
+    def test_created_list_is_returned(self):
+        cursor = self.sync()['cursor']
+        self.age_board()
+        self.client.post(reverse('list-list-create', kwargs={'board_pk': self.board.pk}), {'title': 'New List'}, format='json')
+        changes = self.sync(cursor)
+        self.assertEqual([board_list['title'] for board_list in changes['lists']], ['New List'])
+        self.assertEqual(changes['tasks'], [])
+
+    def test_shifted_tasks_are_returned(self):
+        task2 = Task.objects.create(title='Task 2', list=self.list, position=1)
+        cursor = self.sync()['cursor']
+        self.age_board()
+        new_task = Task.objects.create(title='Task 3', list=self.list, position=2)
+        url = reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': new_task.pk})
+        self.client.patch(url, {'position': 0}, format='json')
+        changes = self.sync(cursor)
+        self.assertEqual({task['id']: task['position'] for task in changes['tasks']}, {new_task.pk: 0, self.task.pk: 1, task2.pk: 2})
+
+    def test_deleted_task_and_list_are_returned(self):
+        list2 = List.objects.create(title='Test List 2', board=self.board, position=1)
+        cursor = self.sync()['cursor']
+        self.age_board()
+        self.client.delete(reverse('task-detail', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk, 'task_pk': self.task.pk}))
+        self.client.delete(reverse('list-detail', kwargs={'board_pk': self.board.pk, 'list_pk': list2.pk}))
+        changes = self.sync(cursor)
+        self.assertEqual(changes['deleted'], {'lists': [list2.pk], 'tasks': [self.task.pk]})
+
+    def test_board_update_is_returned(self):
+        cursor = self.sync()['cursor']
+        self.age_board()
+        self.client.patch(reverse('board-detail', kwargs={'board_pk': self.board.pk}), {'title': 'Patched Board'}, format='json')
+        changes = self.sync(cursor)
+        self.assertEqual(changes['board']['title'], 'Patched Board')
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'since': '99999999999999999999999.1'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'since': 'Invalid cursor'})
+
+    def test_someone_elses_board_changes(self):
+        response = self.client.get(reverse('board-changes', kwargs={'board_pk': self.another_user_board.pk}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
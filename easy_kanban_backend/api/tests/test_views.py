@@ -6,6 +6,9 @@ from django.contrib.auth.models import User
 from api.models import Board, List, Task
 from api.serializers import BoardBasicSerializer, BoardSerializer, ListSerializer, TaskSerializer, TaskPatchSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 class GetCSRFTokenTestCase(TestCase):
@@ -127,6 +130,33 @@ class BoardRetrieveUpdateDestroyTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Test Board')
 
+    def test_retrieve_board_returns_ordered_lists_and_tasks(self):
+        list2 = List.objects.create(title='List 2', board=self.board, position=1)
+        list1 = List.objects.create(title='List 1', board=self.board, position=0)
+        Task.objects.create(title='Task 2', list=list1, position=1)
+        Task.objects.create(title='Task 1', list=list1, position=0)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([l['title'] for l in response.data['lists']], ['List 1', 'List 2'])
+        self.assertEqual([t['title'] for t in response.data['lists'][0]['tasks']], ['Task 1', 'Task 2'])
+
+    def test_retrieve_board_query_count_does_not_grow_with_board(self):
+        def count_queries():
+            cache.clear()
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(context.captured_queries)
+
+        list = List.objects.create(title='List 0', board=self.board)
+        Task.objects.create(title='Task 0', list=list)
+        small_board_queries = count_queries()
+        for i in range(1, 20):
+            list = List.objects.create(title=f'List {i}', board=self.board, position=i)
+            for j in range(5):
+                Task.objects.create(title=f'Task {j}', list=list, position=j)
+        self.assertEqual(count_queries(), small_board_queries)
+
     def test_retrieve_board_not_found(self):
         response = self.client.get(reverse('board-detail', kwargs={'board_pk': 9999}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -263,6 +293,22 @@ class ListListCreateTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(List.objects.count(), 0)
 
+    def test_create_list_checks_membership_once_without_loading_members(self):
+        def create_list_queries():
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.url, self.list_data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return [query['sql'] for query in context.captured_queries]
+
+        List.objects.create(title='Existing List', board=self.board)
+        # the first request also loads and caches the authenticated user
+        create_list_queries()
+        queries = create_list_queries()
+        self.assertEqual(len([sql for sql in queries if 'EXISTS' in sql]), 1)
+        for i in range(10):
+            self.board.users.add(User.objects.create(username=f'member{i}'))
+        self.assertEqual(len(create_list_queries()), len(queries))
+
     def test_list_lists(self):
         List.objects.create(title='List 1', board=self.board)
         List.objects.create(title='List 2', board=self.board)
@@ -654,6 +700,16 @@ class TaskRetrieveUpdateDestroyTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Task.objects.get(pk=self.task.id).position, 6)
 
+    def test_patch_task_list_on_another_board(self):
+        board2 = Board.objects.create(title='Test Board 2')
+        board2.users.add(self.user)
+        list2 = List.objects.create(title='Test List 2', board=board2)
+        for target in (list2, self.another_user_list):
+            response = self.client.patch(self.url, {'list': target.pk}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('list', response.data)
+        self.assertEqual(Task.objects.get(pk=self.task.id).list, self.list)
+
     def test_update_task_with_list_without_position_does_not_move_positions_of_bottom_tasks(self):
         task0= Task.objects.create(title='Task 0', list=self.list, position=0)
         task2 = Task.objects.create(title='Task 2', list=self.list, position=5)
@@ -749,3 +805,73 @@ class TaskRetrieveUpdateDestroyTestCase(TestCase):
   
 
 
+
+    def test_patch_task_position_shifts_bottom_tasks_with_single_update(self):
+        for i in range(1, 6):
+            Task.objects.create(title=f'Task {i}', list=self.list, position=i)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(self.url, {'position': 2}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE "api_task"')]
+        self.assertEqual(len(updates), 2) # the moved task and the shifted tasks below it
+        self.assertEqual(list(Task.objects.filter(list=self.list).values_list('position', flat=True)), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(Task.objects.get(pk=self.task.pk).position, 2)
+
+
+class TaskReorderTestCase(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.board = Board.objects.create(title='Test Board')
+        self.board.users.add(self.user)
+        self.list = List.objects.create(title='Test List', board=self.board)
+        self.tasks = [Task.objects.create(title=f'Task {i}', list=self.list, position=i) for i in range(4)]
+        self.url = reverse('task-reorder', kwargs={'board_pk': self.board.pk, 'list_pk': self.list.pk})
+        self.another_user = User.objects.create_user(username='anotheruser', password='anotherpassword')
+        self.another_user_board = Board.objects.create(title='Another User Board')
+        self.another_user_board.users.add(self.another_user)
+        self.another_user_list = List.objects.create(title='Another User List', board=self.another_user_board)
+
+    def test_reorder_tasks(self):
+        task_ids = [self.tasks[2].pk, self.tasks[0].pk, self.tasks[3].pk, self.tasks[1].pk]
+        response = self.client.put(self.url, {'tasks': task_ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['id'] for task in response.data], task_ids)
+        self.assertEqual(list(Task.objects.filter(list=self.list).values_list('id', flat=True)), task_ids)
+        self.assertEqual(list(Task.objects.filter(list=self.list).values_list('position', flat=True)), [0, 1, 2, 3])
+
+    def test_reorder_tasks_uses_single_update(self):
+        task_ids = [task.pk for task in reversed(self.tasks)]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(self.url, {'tasks': task_ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len([query for query in context.captured_queries if query['sql'].startswith('UPDATE "api_task"')]), 1)
+
+    def test_reorder_tasks_with_missing_task(self):
+        response = self.client.put(self.url, {'tasks': [task.pk for task in self.tasks[1:]]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Task.objects.get(pk=self.tasks[1].pk).position, 1)
+
+    def test_reorder_tasks_with_task_from_another_list(self):
+        another_task = Task.objects.create(title='Another Task', list=self.another_user_list)
+        task_ids = [task.pk for task in self.tasks] + [another_task.pk]
+        response = self.client.put(self.url, {'tasks': task_ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reorder_tasks_with_duplicate_ids(self):
+        task_ids = [task.pk for task in self.tasks] + [self.tasks[0].pk]
+        response = self.client.put(self.url, {'tasks': task_ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reorder_someone_elses_tasks(self):
+        url = reverse('task-reorder', kwargs={'board_pk': self.another_user_board.pk, 'list_pk': self.another_user_list.pk})
+        response = self.client.put(url, {'tasks': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_reorder_tasks_of_list_from_another_board(self):
+        url = reverse('task-reorder', kwargs={'board_pk': self.board.pk, 'list_pk': self.another_user_list.pk})
+        response = self.client.put(url, {'tasks': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import BoardListCreate, BoardRetrieveUpdateDestroy, ListListCreate, ListRetrieveUpdateDestroy, TaskListCreate, TaskRetrieveUpdateDestroy, get_csrf_token, ListForward, ListBackward, create_test_data, RegisterView, remove_test_users    
+from .views import BoardListCreate, BoardImport, BoardExport, BoardRetrieveUpdateDestroy, BoardChanges, BoardBatch, ListListCreate, ListRetrieveUpdateDestroy, TaskListCreate, TaskRetrieveUpdateDestroy, TaskReorder, TaskSearch, get_csrf_token, ListForward, ListBackward, create_test_data, RegisterView, remove_test_users    
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -12,8 +12,13 @@ urlpatterns = [
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('csrf-token/', get_csrf_token, name='get-csrf-token'),
 
+    path('search/', TaskSearch.as_view(), name='task-search'),
     path('board/', BoardListCreate.as_view(), name='board-list-create'),
+    path('board/import/', BoardImport.as_view(), name='board-import'),
+    path('board/export/', BoardExport.as_view(), name='board-export'),
     path('board/<int:board_pk>/', BoardRetrieveUpdateDestroy.as_view(), name='board-detail'),
+    path('board/<int:board_pk>/changes/', BoardChanges.as_view(), name='board-changes'),
+    path('board/<int:board_pk>/batch/', BoardBatch.as_view(), name='board-batch'),
     
     path('board/<int:board_pk>/list/', ListListCreate.as_view(), name='list-list-create'),
     path('board/<int:board_pk>/list/<int:list_pk>/', ListRetrieveUpdateDestroy.as_view(), name='list-detail'),
@@ -21,6 +26,7 @@ urlpatterns = [
     path('board/<int:board_pk>/list/<int:list_pk>/backward/', ListBackward.as_view(), name='list-backward'),
     
     path('board/<int:board_pk>/list/<int:list_pk>/task/', TaskListCreate.as_view(), name='task-list-create'),
+    path('board/<int:board_pk>/list/<int:list_pk>/task/reorder/', TaskReorder.as_view(), name='task-reorder'),
     path('board/<int:board_pk>/list/<int:list_pk>/task/<int:task_pk>/', TaskRetrieveUpdateDestroy.as_view(), name='task-detail'),
 
     path('create_test_data/', create_test_data, name='create-test-data'),
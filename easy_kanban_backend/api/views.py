@@ -1,78 +1,405 @@
 from django.shortcuts import get_object_or_404
-from rest_framework import generics
+from rest_framework import generics, status
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Board, List, Task
-from .serializers import BoardBasicSerializer, BoardSerializer, ListSerializer, TaskSerializer, TaskPatchSerializer
-from django.http import JsonResponse
+from .models import Board, List, Task, Tombstone
+from .cache import board_etag, bump_board_version, get_board_payload
+from .batch import apply_batch
+from .events import publish_board_event
+from .exporting import aiter_chunks, export_records, to_ndjson
+from .fastpath import TASK_PATCH_FIELDS, render_board, render_lists, render_tasks
+from .importing import BoardImporter
+from .memberships import claimed_board_ids
+from .pagination import BoardCursorPagination, OptInCursorPagination, SearchPagination
+from .parsers import FastJSONParser, NDJSONParser, loads
+from .search import get_search_backend
+from .summaries import annotate_summary, lists_with_task_counts
+from .sync import get_board_changes, parse_cursor
+from .ordering import append, make_room, position_step, step_backward, step_forward
+from .serializers import nested_field_names, BoardBatchSerializer, BoardImportSerializer, BoardSerializer, BoardSummarySerializer, ImportBoardSerializer, ImportListSerializer, ImportTaskSerializer, ListSerializer, TaskSerializer, TaskPatchSerializer, TaskReorderSerializer, TaskSearchSerializer
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated, BasePermission
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import APIException, PermissionDenied, ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.mediatypes import media_type_matches
 from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch, Value
 from django.contrib.auth.models import User
 from .serializers import RegisterSerializer
 
 
 
+def get_member_board(request, board_pk):
+    """
+    Return the board annotated with ``is_member`` for the requesting user.
+
+    Membership is resolved with a single EXISTS subquery on the board/user
+    through table, or taken from the membership claims of the access token,
+    and the result is cached on the request, so later checks in the same
+    request do not hit the database again.
+    """
+    boards = getattr(request, '_member_boards', None)
+    if boards is None:
+        boards = request._member_boards = {}
+    if board_pk not in boards:
+        if is_claimed_board(request, board_pk):
+            queryset = Board.objects.annotate(is_member=Value(True))
+        else:
+            membership = Board.users.through.objects.filter(board_id=OuterRef('pk'), user_id=request.user.id)
+            queryset = Board.objects.annotate(is_member=Exists(membership))
+        boards[board_pk] = get_object_or_404(queryset, pk=board_pk)
+    return boards[board_pk]
+
+
+def is_claimed_board(request, board_pk):
+    """Whether the up to date membership claims of the access token include the board, see api/memberships.py."""
+    board_ids = claimed_board_ids(request)
+    return board_ids is not None and board_pk in board_ids
+
+
+def get_board_list(request, board_pk, list_pk):
+    """Return the list linked to the board, cached on the request like get_member_board."""
+    lists = getattr(request, '_board_lists', None)
+    if lists is None:
+        lists = request._board_lists = {}
+    if (board_pk, list_pk) not in lists:
+        board_list = get_object_or_404(List, pk=list_pk, board_id=board_pk)
+        boards = getattr(request, '_member_boards', {})
+        if board_pk in boards:
+            board_list.board = boards[board_pk]
+        lists[(board_pk, list_pk)] = board_list
+    return lists[(board_pk, list_pk)]
+
+
 class IsBoardMember(BasePermission):
     def has_permission(self, request, view):
         board_pk = view.kwargs.get('board_pk')
-        board = get_object_or_404(Board, pk=board_pk)
-        return request.user in board.users.all()
+        # boards the token vouches for are not read until the view needs them
+        return is_claimed_board(request, board_pk) or get_member_board(request, board_pk).is_member
 
 class IsListLinkedToBoard(BasePermission):
     def has_permission(self, request, view):
         list_pk = view.kwargs.get('list_pk')
-        return get_object_or_404(List, pk=list_pk, board__id=view.kwargs.get('board_pk'))
+        return bool(get_board_list(request, view.kwargs.get('board_pk'), list_pk))
     
 
-class BoardListCreate(generics.ListCreateAPIView):
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource has been modified since it was read.'
+    default_code = 'precondition_failed'
+
+
+class SparseFieldsViewMixin:
+    """
+    Read ``?fields=`` (comma separated, ``lists.title`` selects inside nested items) and ``?depth=``
+    (levels of nested lists/tasks) on GET requests and pass them to the serializer context, see
+    SparseFieldsMixin. Querysets use ``wants`` and ``only_requested`` to skip prefetches and columns of
+    fields left out.
+    """
+    default_depth = None
+
+    def get_sparse_params(self):
+        if not hasattr(self, '_sparse_params'):
+            fields, depth = None, self.default_depth
+            if self.request.method == 'GET':
+                if self.request.query_params.get('fields'):
+                    fields = {field.strip() for field in self.request.query_params['fields'].split(',') if field.strip()}
+                if self.request.query_params.get('depth'):
+                    try:
+                        depth = int(self.request.query_params['depth'])
+                    except ValueError:
+                        depth = -1
+                    if depth < 0:
+                        raise ValidationError({'depth': 'Must be a non-negative integer'})
+            self._sparse_params = fields, depth
+        return self._sparse_params
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'], context['depth'] = self.get_sparse_params()
+        return context
+
+    def get_sparse_variant(self):
+        """Canonical form of the parameters, for cache keys and ETags."""
+        fields, depth = self.get_sparse_params()
+        variant = []
+        if fields is not None:
+            variant.append(f"fields={','.join(sorted(fields))}")
+        if depth is not None:
+            variant.append(f'depth={depth}')
+        return ';'.join(variant)
+
+    def requested_fields(self, path=''):
+        """Field names selected inside ``path`` (e.g. ``'lists.tasks'``), None when all of them are."""
+        fields = self.get_sparse_params()[0]
+        for name in filter(None, path.split('.')):
+            fields = nested_field_names(fields, name)
+        return fields
+
+    def wants(self, path, nested=True):
+        """Whether the field at ``path`` is part of the response, ``nested`` ones also count against depth."""
+        depth = self.get_sparse_params()[1]
+        if nested and depth is not None and path.count('.') + 1 > depth:
+            return False
+        parent, _, name = path.rpartition('.')
+        selected = self.requested_fields(parent)
+        return selected is None or name in {field.split('.', 1)[0] for field in selected}
+
+    def only_requested(self, queryset, path='', *required):
+        """Load only the columns of ``queryset`` selected at ``path``, plus the ``required`` ones."""
+        selected = self.requested_fields(path)
+        if selected is None:
+            return queryset
+        columns = {field.name for field in queryset.model._meta.concrete_fields}
+        return queryset.only('id', 'position', *required, *({field.split('.', 1)[0] for field in selected} & columns))
+
+
+class BoardVersionMixin(SparseFieldsViewMixin):
+    """
+    Tie a view to the version of its board.
+
+    Writes run in a transaction that bumps the version, which invalidates cached board payloads, and
+    reads carry a strong ETag derived from it. Conditional GETs are answered with 304 before any
+    serialization, and PUT/PATCH/DELETE with a stale If-Match are rejected with 412. Successful writes
+    are published to the board's WebSocket subscribers as ``<model>.created/updated/deleted`` events.
+
+    Views with ``fast_path`` render full reads with ``render_fast_retrieve``/``render_fast_list`` from
+    values() rows when ``FAST_READ_RENDERING`` is on, see api/fastpath.py.
+    """
+    fast_path = False
+
+    def get_etag(self):
+        board = get_member_board(self.request, self.kwargs['board_pk'])
+        resource = f'{self.lookup_url_kwarg}:{self.kwargs.get(self.lookup_url_kwarg)}'
+        if variant := self.get_sparse_variant():
+            resource = f'{resource};{variant}'
+        return board_etag(board, resource)
+
+    def use_fast_path(self):
+        return self.fast_path and settings.FAST_READ_RENDERING and not self.get_sparse_variant()
+
+    def get_retrieve_data(self):
+        if self.use_fast_path():
+            data = self.render_fast_retrieve()
+            if data is None:
+                raise Http404
+            return data
+        return self.get_serializer(self.get_object()).data
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_path():
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.render_fast_list(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        return Response(self.get_retrieve_data(), headers={'ETag': etag})
+
+    def create(self, request, *args, **kwargs):
+        response = self.write(super().create, request, *args, **kwargs)
+        self.publish('created', response.data)
+        return response
+
+    def update(self, request, *args, **kwargs):
+        response = self.write(super().update, request, *args, **kwargs)
+        get_member_board(request, self.kwargs['board_pk']).refresh_from_db(fields=['version'])
+        response['ETag'] = self.get_etag()
+        self.publish('updated', response.data)
+        return response
+
+    def destroy(self, request, *args, **kwargs):
+        response = self.write(super().destroy, request, *args, **kwargs)
+        self.publish('deleted', {'id': int(self.kwargs[self.lookup_url_kwarg])})
+        return response
+
+    def publish(self, action, data):
+        model_name = self.get_serializer_class().Meta.model._meta.model_name
+        publish_board_event(self.kwargs['board_pk'], f'{model_name}.{action}', data)
+
+    def write(self, handler, request, *args, **kwargs):
+        expected_version = None
+        if_match = request.headers.get('If-Match')
+        if if_match is not None:
+            if not self.etag_matches(if_match):
+                raise PreconditionFailed()
+            expected_version = get_member_board(request, self.kwargs['board_pk']).version
+        with transaction.atomic():
+            # with If-Match the bump only succeeds if nobody else wrote since the ETag was checked
+            if not bump_board_version(self.kwargs['board_pk'], expected_version) and expected_version is not None:
+                raise PreconditionFailed()
+            return handler(request, *args, **kwargs)
+
+    def etag_matches(self, if_match):
+        etags = parse_etags(if_match)
+        return '*' in etags or self.get_etag() in etags
+
+
+class BoardListCreate(SparseFieldsViewMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
-    serializer_class = BoardBasicSerializer
+    serializer_class = BoardSummarySerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['title']
+    pagination_class = BoardCursorPagination
+    # per-list counts cost a prefetch query, so they are only included with ?depth=1
+    default_depth = 0
 
     def get_queryset(self):
         user_id = self.request.user.id
-        return Board.objects.filter(users__id=user_id)
+        queryset = Board.objects.filter(users__id=user_id)
+        if self.request.method == 'GET':
+            queryset = annotate_summary(queryset, *(self.wants(name, nested=False) for name in ('list_count', 'task_count', 'last_activity')))
+        if self.wants('users', nested=False):
+            queryset = queryset.prefetch_related('users')
+        if self.wants('lists'):
+            queryset = queryset.prefetch_related(Prefetch('lists', queryset=lists_with_task_counts()))
+        return queryset
+
+
+class BoardImport(generics.GenericAPIView):
+    """
+    Create boards for the current user from a nested ``{"boards": [...]}`` JSON document, or from
+    ``application/x-ndjson`` records streamed one per line. Each record has a ``type`` of ``board``,
+    ``list`` or ``task`` and belongs to the last board or list before it. Everything is written in one
+    transaction and the created ids are returned.
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = BoardImportSerializer
+    parser_classes = [FastJSONParser, NDJSONParser]
+    record_serializers = {'board': ImportBoardSerializer, 'list': ImportListSerializer, 'task': ImportTaskSerializer}
+
+    def post(self, request, *args, **kwargs):
+        importer = BoardImporter([request.user.id])
+        with transaction.atomic():
+            if media_type_matches(NDJSONParser.media_type, request.content_type):
+                for line_number, record in request.data:
+                    self.import_record(importer, line_number, record)
+            else:
+                serializer = self.get_serializer(data=request.data)
+                serializer.is_valid(raise_exception=True)
+                for board in serializer.validated_data['boards']:
+                    importer.add_board(board)
+            created = importer.finish()
+        return Response(created, status=status.HTTP_201_CREATED)
+
+    def import_record(self, importer, line_number, record):
+        record_type = record.get('type') if isinstance(record, dict) else None
+        if record_type not in self.record_serializers:
+            raise ValidationError({'line': line_number, 'type': 'Must be one of board, list or task'})
+        serializer = self.record_serializers[record_type](data=record)
+        if not serializer.is_valid():
+            raise ValidationError({'line': line_number, **serializer.errors})
+        try:
+            getattr(importer, f'add_{record_type}')(serializer.validated_data)
+        except ValueError as error:
+            raise ValidationError({'line': line_number, 'type': str(error)})
+
+
+class BoardExport(generics.GenericAPIView):
+    """Stream every board of the current user with its lists and tasks as NDJSON, see api/exporting.py."""
+    permission_classes = [IsAuthenticated]
 
+    def get(self, request, *args, **kwargs):
+        boards = Board.objects.filter(users__id=request.user.id)
+        lines = to_ndjson(export_records(boards))
+        if isinstance(request._request, ASGIRequest):
+            lines = aiter_chunks(lines)
+        response = StreamingHttpResponse(lines, content_type=NDJSONParser.media_type)
+        response['Content-Disposition'] = 'attachment; filename="boards.ndjson"'
+        return response
 
-class BoardRetrieveUpdateDestroy(generics.RetrieveUpdateDestroyAPIView):
+
+class BoardRetrieveUpdateDestroy(BoardVersionMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated, IsBoardMember]
-    queryset = Board.objects.all()
     serializer_class = BoardSerializer
     lookup_field = 'pk'
     lookup_url_kwarg = 'board_pk'
+    fast_path = True
+
+    def get_queryset(self):
+        queryset = Board.objects.all()
+        if self.wants('users', nested=False):
+            queryset = queryset.prefetch_related(Prefetch('users', queryset=User.objects.order_by('id')))
+        if self.wants('lists'):
+            queryset = queryset.prefetch_related('lists')
+        if self.wants('lists.tasks'):
+            tasks = self.only_requested(Task.objects.all(), 'lists.tasks', 'list')
+            queryset = queryset.prefetch_related(Prefetch('lists__tasks', queryset=tasks))
+        return queryset
+
+    def get_retrieve_data(self):
+        board = get_member_board(self.request, self.kwargs['board_pk'])
+        return get_board_payload(board, super().get_retrieve_data, self.get_sparse_variant())
+
+    def render_fast_retrieve(self):
+        return render_board(self.kwargs['board_pk'])
 
 
 # List Views
-class ListListCreate(generics.ListCreateAPIView):
+class ListTasksMixin:
+    """Prefetch the tasks of lists, only when and as far as the response includes them."""
+
+    def prefetch_tasks(self, queryset):
+        if not self.wants('tasks'):
+            return queryset
+        return queryset.prefetch_related(Prefetch('tasks', queryset=self.only_requested(Task.objects.all(), 'tasks', 'list')))
+
+
+class ListListCreate(ListTasksMixin, BoardVersionMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated, IsBoardMember]
     serializer_class = ListSerializer
+    pagination_class = OptInCursorPagination
+    fast_path = True
 
     def get_queryset(self):
         board_pk = self.kwargs['board_pk']
-        return List.objects.filter(board__id=board_pk, board__users__id=self.request.user.id)
+        return self.prefetch_tasks(List.objects.filter(board__id=board_pk, board__users__id=self.request.user.id))
+
+    def render_fast_list(self, queryset):
+        return render_lists(queryset)
 
     def perform_create(self, serializer):
-        board_pk = self.kwargs['board_pk']
-        board = get_object_or_404(Board, pk=board_pk)
-        if self.request.user not in board.users.filter(pk=self.request.user.id):
+        board = get_member_board(self.request, self.kwargs['board_pk'])
+        if not board.is_member:
             raise PermissionDenied()
-        serializer.save(board=board, position=board.get_next_position())
+        append(serializer, board, List.objects.filter(board=board), board=board)
 
-class ListRetrieveUpdateDestroy(generics.RetrieveUpdateDestroyAPIView):
+class ListRetrieveUpdateDestroy(ListTasksMixin, BoardVersionMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated, IsBoardMember]
     serializer_class = ListSerializer
     lookup_field = 'pk'
     lookup_url_kwarg = 'list_pk'
+    fast_path = True
 
     def get_queryset(self):
         board_pk = self.kwargs['board_pk']
-        return List.objects.filter(board_id=board_pk)
+        return self.prefetch_tasks(List.objects.filter(board_id=board_pk))
+
+    def render_fast_retrieve(self):
+        lists = render_lists(self.filter_queryset(self.get_queryset()).filter(pk=self.kwargs['list_pk']))
+        return lists[0] if lists else None
+
+    def perform_destroy(self, instance):
+        Tombstone.objects.create(board_id=self.kwargs['board_pk'], kind=Tombstone.LIST, object_id=instance.pk)
+        instance.delete()
 
 
-class ListForwardBackward(generics.UpdateAPIView):
+class ListForwardBackward(BoardVersionMixin, generics.UpdateAPIView):
     permission_classes = [IsAuthenticated, IsBoardMember]
     serializer_class = ListSerializer
     lookup_field = 'pk'
@@ -80,19 +407,15 @@ class ListForwardBackward(generics.UpdateAPIView):
 
     def get_queryset(self):
         board_pk = self.kwargs['board_pk']
-        return List.objects.filter(board_id=board_pk)
+        return List.objects.filter(board_id=board_pk).prefetch_related('tasks')
 
 class ListForward(ListForwardBackward):
 
     def perform_update(self, serializer):
         with transaction.atomic():
             targetList = serializer.instance
-            if targetList.position < (targetList.board.get_next_position()-1):
-                serializer.validated_data['position'] = targetList.position + 1
-                other_list = targetList.board.lists.exclude(pk=targetList.pk).filter(position=targetList.position + 1).first()
-                if other_list:
-                    other_list.position -= 1
-                    other_list.save()
+            siblings = List.objects.filter(board_id=targetList.board_id)
+            serializer.validated_data['position'] = step_forward(targetList, siblings)
             serializer.save()
 
 class ListBackward(ListForwardBackward):
@@ -100,57 +423,149 @@ class ListBackward(ListForwardBackward):
     def perform_update(self, serializer):
         with transaction.atomic():
             targetList = serializer.instance
-            if targetList.position > 0:
-                serializer.validated_data['position'] = targetList.position - 1
-                other_list = targetList.board.lists.exclude(pk=targetList.pk).filter(position=targetList.position - 1).first()
-                if other_list:
-                    other_list.position += 1
-                    other_list.save()
+            siblings = List.objects.filter(board_id=targetList.board_id)
+            serializer.validated_data['position'] = step_backward(targetList, siblings)
             serializer.save()
 
 
 # Task Views
-class TaskListCreate(generics.ListCreateAPIView):
+class TaskListCreate(BoardVersionMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated, IsBoardMember, IsListLinkedToBoard]
     serializer_class = TaskSerializer
+    pagination_class = OptInCursorPagination
+    fast_path = True
 
     def get_queryset(self):
         board_pk = self.kwargs['board_pk']
         list_pk = self.kwargs['list_pk']
-        return Task.objects.filter(list_id=list_pk, list__board_id=board_pk)
+        return self.only_requested(Task.objects.filter(list_id=list_pk, list__board_id=board_pk))
+
+    def render_fast_list(self, queryset):
+        return render_tasks(queryset)
 
     def perform_create(self, serializer):
-        board_pk = self.kwargs['board_pk']
-        list_pk = self.kwargs['list_pk']
-        task_list = get_object_or_404(List, pk=list_pk, board_id=board_pk)
-        serializer.save(list=task_list, position=task_list.get_next_position())
+        task_list = get_board_list(self.request, self.kwargs['board_pk'], self.kwargs['list_pk'])
+        append(serializer, task_list, Task.objects.filter(list=task_list), list=task_list)
 
-class TaskRetrieveUpdateDestroy(generics.RetrieveUpdateDestroyAPIView):
+class TaskRetrieveUpdateDestroy(BoardVersionMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated, IsBoardMember, IsListLinkedToBoard]
     serializer_class = TaskPatchSerializer
     lookup_field = 'pk'
     lookup_url_kwarg = 'task_pk'
+    fast_path = True
 
     def get_queryset(self):
         board_pk = self.kwargs['board_pk']
         list_pk = self.kwargs['list_pk']
-        return Task.objects.filter(list_id=list_pk, list__board_id=board_pk)
+        return self.only_requested(Task.objects.filter(list_id=list_pk, list__board_id=board_pk))
+
+    def render_fast_retrieve(self):
+        tasks = render_tasks(self.filter_queryset(self.get_queryset()).filter(pk=self.kwargs['task_pk']), TASK_PATCH_FIELDS)
+        return tasks[0] if tasks else None
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if 'list' in serializer.fields:
+            # tasks only move between lists of the board they are on, whose version the write bumps
+            serializer.fields['list'].queryset = List.objects.filter(board_id=self.kwargs['board_pk'])
+        return serializer
     
     def perform_update(self, serializer):
         targetList = serializer.validated_data.get('list')
-        if targetList and (serializer.validated_data.get('position') is None):
-            serializer.validated_data['position'] = targetList.get_next_position()
-            serializer.save()
-        elif serializer.validated_data.get('position') is not None:
-            serializer.save()
-            targetList = serializer.instance.list if targetList is None else targetList
-            otherTasks = targetList.tasks.exclude(pk=serializer.instance.pk)
-            for task in otherTasks:
-                if task.position >= serializer.validated_data.get('position'):
-                    task.position += 1
-                    task.save()
-        else:
-            serializer.save()
+        position = serializer.validated_data.get('position')
+        with transaction.atomic():
+            if targetList and position is None:
+                serializer.validated_data['position'] = targetList.get_next_position()
+                serializer.save()
+            elif position is not None:
+                task = serializer.instance
+                siblings = Task.objects.filter(list=targetList or task.list_id)
+                serializer.validated_data['position'] = make_room(task, siblings, position)
+                serializer.save()
+            else:
+                serializer.save()
+
+    def perform_destroy(self, instance):
+        Tombstone.objects.create(board_id=self.kwargs['board_pk'], kind=Tombstone.TASK, object_id=instance.pk)
+        instance.delete()
+
+
+class TaskReorder(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated, IsBoardMember, IsListLinkedToBoard]
+    serializer_class = TaskReorderSerializer
+
+    def put(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        task_ids = serializer.validated_data['tasks']
+        task_list = get_board_list(request, kwargs['board_pk'], kwargs['list_pk'])
+        with transaction.atomic():
+            tasks = {task.pk: task for task in task_list.tasks.select_for_update()}
+            if set(tasks) != set(task_ids):
+                raise ValidationError({'tasks': 'Task ids must match exactly the tasks of the list'})
+            ordered_tasks = [tasks[task_id] for task_id in task_ids]
+            step = position_step()
+            now = timezone.now()
+            for position, task in enumerate(ordered_tasks):
+                task.position = position * step
+                task.updated_at = now
+            Task.objects.bulk_update(ordered_tasks, ['position', 'updated_at'])
+            bump_board_version(kwargs['board_pk'])
+        data = TaskSerializer(ordered_tasks, many=True).data
+        publish_board_event(kwargs['board_pk'], 'task.reordered', {'list': task_list.pk, 'tasks': data})
+        return Response(data)
+
+
+class BoardBatch(BoardVersionMixin, generics.GenericAPIView):
+    """
+    Apply an ordered array of list and task operations (see api/batch.py) in one transaction, with a
+    single membership check and version bump, and return one result per operation.
+    """
+    permission_classes = [IsAuthenticated, IsBoardMember]
+    serializer_class = BoardBatchSerializer
+    lookup_url_kwarg = 'board_pk'
+    events = {'create': 'created', 'update': 'updated', 'move': 'updated', 'delete': 'deleted'}
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = self.write(self.apply, request, serializer.validated_data['operations'])
+        board = get_member_board(request, kwargs['board_pk'])
+        board.refresh_from_db(fields=['version'])
+        for result in results:
+            data = result.get('data', {'id': result['id']})
+            publish_board_event(board.pk, f"{result['type']}.{self.events[result['op']]}", data)
+        return Response({'results': results}, headers={'ETag': self.get_etag()})
+
+    def apply(self, request, operations):
+        return apply_batch(get_member_board(request, self.kwargs['board_pk']), operations)
+
+
+class TaskSearch(generics.ListAPIView):
+    """Tasks of every board of the current user matching ``?q=``, best matches first, see api/search.py."""
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskSearchSerializer
+    pagination_class = SearchPagination
+
+    def get_queryset(self):
+        query = self.request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({'q': 'This query parameter is required.'})
+        tasks = Task.objects.filter(list__board__users__id=self.request.user.id).select_related('list')
+        return get_search_backend().search(tasks, query)
+
+
+class BoardChanges(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated, IsBoardMember]
+
+    def get(self, request, *args, **kwargs):
+        board = get_member_board(request, kwargs['board_pk'])
+        since = request.query_params.get('since')
+        try:
+            cursor = parse_cursor(since) if since else None
+        except (ValueError, OverflowError):
+            raise ValidationError({'since': 'Invalid cursor'})
+        return Response(get_board_changes(board, cursor))
 
 
 @api_view(['GET'])
@@ -164,23 +579,43 @@ def get_csrf_token(request):
 @permission_classes([IsAuthenticated])
 def create_test_data(request):
     testUser = request.data.get('boards')[0].get('users')[0]
-    Board.objects.filter(users__id=testUser).delete()
+    serializer = BoardImportSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
 
-    for board in request.data.get('boards'):
-        board_instance = Board.objects.create(title=board.get('title'))
-        board_instance.users.add(testUser)
-        for list in board.get('lists'):
-            list_instance = List.objects.create(title=list.get('title'), board=board_instance, position=list.get('position'))
-            for task in list.get('tasks'):
-                Task.objects.create(title=task.get('title'), description=task.get('description'), list=list_instance, position=task.get('position'))
+    importer = BoardImporter([testUser])
+    with transaction.atomic():
+        Board.objects.filter(users__id=testUser).delete()
+        for board in serializer.validated_data['boards']:
+            importer.add_board(board)
+        importer.finish()
 
     return JsonResponse({'message': 'Test data created successfully'})
 
 
-class RegisterView(generics.CreateAPIView):
-    queryset = User.objects.all()
-    permission_classes = (AllowAny,)
-    serializer_class = RegisterSerializer
+@method_decorator(csrf_exempt, name='dispatch')
+class RegisterView(View):
+    """
+    Register a user and create their initial boards.
+
+    The view is async: under ASGI the password hash, the slow part of a registration, runs in a thread
+    pool instead of blocking the event loop, while validation and the writes run in the thread that
+    holds the database connection. Accepts JSON or form data like the rest of the API.
+    """
+
+    async def post(self, request):
+        if request.content_type == 'application/json':
+            try:
+                data = loads(request.body, request.encoding or settings.DEFAULT_CHARSET)
+            except ValueError as exc:
+                return JsonResponse({'detail': f'JSON parse error - {exc}'}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            data = request.POST
+        serializer = RegisterSerializer(data=data)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        password_hash = await sync_to_async(make_password, thread_sensitive=False)(serializer.validated_data['password'])
+        await sync_to_async(serializer.save)(password_hash=password_hash)
+        return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
 
 
 @api_view(['GET'])
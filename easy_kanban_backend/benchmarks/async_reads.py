@@ -0,0 +1,131 @@
+"""
+Concurrent read throughput of the board detail, list listing and task listing
+endpoints through the WSGI handler with a thread pool, as a threaded WSGI
+server runs it, against the ASGI handler serving them from the DRF views and
+from the async views of api/async_views.py (ASYNC_READ_VIEWS). Requests go
+through the full middleware stack, in process, without a network server.
+
+    python -m benchmarks.async_reads
+"""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import cycle, islice
+
+from benchmarks.common import benchmark_database, seed_board, setup
+
+REQUESTS = 600
+CONCURRENCY = [1, 10, 50]
+LISTS = 10
+TASKS_PER_LIST = 20
+
+
+def wsgi_get(handler, path, token):
+    environ = {
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SCRIPT_NAME': '',
+        'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': 'localhost', 'HTTP_AUTHORIZATION': f'Bearer {token}',
+        'wsgi.url_scheme': 'http', 'wsgi.input': BytesIO(), 'wsgi.errors': sys.stderr,
+    }
+    statuses = []
+    response = handler(environ, lambda status, headers: statuses.append(status))
+    try:
+        b''.join(response)
+    finally:
+        response.close()
+    return int(statuses[0].split()[0])
+
+
+async def asgi_get(handler, path, token):
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+        'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+        'headers': [(b'host', b'localhost'), (b'authorization', f'Bearer {token}'.encode())],
+        'server': ('localhost', 80), 'client': ('127.0.0.1', 50000),
+    }
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        # the client never disconnects, the handler cancels this once it has responded
+        await asyncio.Future()
+
+    async def send(message):
+        sent.append(message)
+
+    await handler(scope, receive, send)
+    return sent[0]['status']
+
+
+def run_wsgi(paths, token, concurrency):
+    from django.core.handlers.wsgi import WSGIHandler
+    handler = WSGIHandler()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        statuses = list(executor.map(lambda path: wsgi_get(handler, path, token), paths))
+        return time.perf_counter() - start, statuses
+
+
+def run_asgi(paths, token, concurrency, async_views):
+    from django.test.utils import override_settings
+    from easy_kanban_backend.asgi import ReadViewsASGIHandler
+    handler = ReadViewsASGIHandler()
+
+    async def run():
+        slots = asyncio.Semaphore(concurrency)
+
+        async def limited(path):
+            async with slots:
+                return await asgi_get(handler, path, token)
+
+        start = time.perf_counter()
+        statuses = await asyncio.gather(*(limited(path) for path in paths))
+        return time.perf_counter() - start, statuses
+
+    with override_settings(ASYNC_READ_VIEWS=async_views):
+        return asyncio.run(run())
+
+
+def main():
+    setup()
+    from django.contrib.auth.models import User
+    from django.urls import reverse
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    runners = {
+        'WSGI, DRF views': run_wsgi,
+        'ASGI, DRF views': lambda paths, token, concurrency: run_asgi(paths, token, concurrency, False),
+        'ASGI, async views': lambda paths, token, concurrency: run_asgi(paths, token, concurrency, True),
+    }
+
+    with benchmark_database():
+        user = User.objects.create_user(username='benchmark', password='benchmark')
+        token = str(RefreshToken.for_user(user).access_token)
+        board = seed_board(LISTS, TASKS_PER_LIST, user)
+        board_list = board.lists.first()
+        urls = [
+            reverse('board-detail', kwargs={'board_pk': board.pk}),
+            reverse('list-list-create', kwargs={'board_pk': board.pk}),
+            reverse('task-list-create', kwargs={'board_pk': board.pk, 'list_pk': board_list.pk}),
+        ]
+        paths = list(islice(cycle(urls), REQUESTS))
+
+        print(f'{REQUESTS} GETs of {", ".join(urls)}')
+        print(f'{"":<20}' + ''.join(f'{f"{concurrency} concurrent":>16}' for concurrency in CONCURRENCY))
+        for name, runner in runners.items():
+            # warms the user and board caches
+            runner(urls, token, 1)
+            results = []
+            for concurrency in CONCURRENCY:
+                elapsed, statuses = runner(paths, token, concurrency)
+                assert set(statuses) == {200}, set(statuses)
+                results.append(REQUESTS / elapsed)
+            print(f'{name:<20}' + ''.join(f'{rate:>12.0f} r/s' for rate in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The benchmarks run against a throwaway test database created from the
+configured DATABASES settings, so they never touch the development data.
+Run them from the project directory, e.g. ``python -m benchmarks.query_plans``.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+import django
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'easy_kanban_backend.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    from django.db import connection
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def seed_board(lists, tasks_per_list, user=None):
+    """Create a board with ``lists`` lists of ``tasks_per_list`` tasks each using bulk inserts."""
+    from api.models import Board, List, Task
+    board = Board.objects.create(title=f'Benchmark board {lists}x{tasks_per_list}')
+    if user is not None:
+        board.users.add(user)
+    board_lists = List.objects.bulk_create(
+        List(title=f'List {i}', board=board, position=i) for i in range(lists)
+    )
+    Task.objects.bulk_create(
+        (Task(title=f'Task {j}', description=f'Description of task {j}', list=board_list, position=j)
+         for board_list in board_lists for j in range(tasks_per_list)),
+        batch_size=1000,
+    )
+    return board
+
+
+def timed(function, repeat=5):
+    """Return the best wall clock time of ``repeat`` calls of ``function`` in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
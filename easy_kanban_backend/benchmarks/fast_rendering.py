@@ -0,0 +1,42 @@
+"""
+Board rendering through BoardSerializer against the values() fast path of
+api/fastpath.py, on boards with 10, 1k and 50k tasks. Both sides include
+their queries and the JSON encoding of the result.
+
+    python -m benchmarks.fast_rendering
+"""
+from benchmarks.common import benchmark_database, seed_board, setup, timed
+
+# (lists, tasks per list)
+BOARD_SIZES = [(2, 5), (10, 100), (50, 1000)]
+
+
+def main():
+    setup()
+    from rest_framework.renderers import JSONRenderer
+    from api.fastpath import render_board
+    from api.models import Board
+    from api.serializers import BoardSerializer
+
+    renderer = JSONRenderer()
+
+    def serializer_render(board_pk):
+        board = Board.objects.prefetch_related('users', 'lists__tasks').get(pk=board_pk)
+        return renderer.render(BoardSerializer(board).data)
+
+    def fast_render(board_pk):
+        return renderer.render(render_board(board_pk))
+
+    with benchmark_database():
+        print(f'{"tasks":>7} {"serializer":>12} {"fast path":>12} {"speedup":>8}')
+        for lists, tasks_per_list in BOARD_SIZES:
+            board = seed_board(lists, tasks_per_list)
+            assert serializer_render(board.pk) == fast_render(board.pk)
+            repeat = 3 if lists * tasks_per_list > 10000 else 20
+            slow = timed(lambda: serializer_render(board.pk), repeat)
+            fast = timed(lambda: fast_render(board.pk), repeat)
+            print(f'{lists * tasks_per_list:>7} {slow:9.2f} ms {fast:9.2f} ms {slow / fast:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
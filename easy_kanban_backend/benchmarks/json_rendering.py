@@ -0,0 +1,59 @@
+"""
+Throughput of the board detail endpoint with DRF's stdlib JSONRenderer
+against api.renderers.FastJSONRenderer (orjson, when installed). The board
+payload is cached after the first request, so the difference is the
+rendering of the response.
+
+    python -m benchmarks.json_rendering
+"""
+import time
+
+from benchmarks.common import benchmark_database, seed_board, setup
+
+# (lists, tasks per list)
+BOARD_SIZES = [(5, 20), (10, 100), (50, 1000)]
+DURATION = 2.0
+
+
+def requests_per_second(client, url):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        response = client.get(url)
+        count += 1
+    assert response.status_code == 200, response.status_code
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    setup()
+    from django.contrib.auth.models import User
+    from django.test.utils import setup_test_environment
+    from django.urls import reverse
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from api.renderers import FastJSONRenderer, orjson
+    from api.views import BoardRetrieveUpdateDestroy
+
+    setup_test_environment()
+    print(f'orjson {"installed" if orjson is not None else "missing, FastJSONRenderer falls back to stdlib"}')
+    with benchmark_database():
+        user = User.objects.create_user(username='benchmark', password='benchmark')
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+        print(f'{"tasks":>7} {"stdlib":>12} {"fast":>12} {"gain":>7}')
+        for lists, tasks_per_list in BOARD_SIZES:
+            board = seed_board(lists, tasks_per_list, user)
+            url = reverse('board-detail', kwargs={'board_pk': board.pk})
+            results = []
+            for renderer in (JSONRenderer, FastJSONRenderer):
+                BoardRetrieveUpdateDestroy.renderer_classes = [renderer]
+                client.get(url)
+                results.append(requests_per_second(client, url))
+            stdlib, fast = results
+            print(f'{lists * tasks_per_list:>7} {stdlib:8.1f} req/s {fast:8.1f} req/s {fast / stdlib:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
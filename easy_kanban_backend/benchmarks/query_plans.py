@@ -0,0 +1,51 @@
+"""
+Query plans of the position queries with and without the (board, position)
+and (list, position) indexes on a board with 10k tasks.
+
+    python -m benchmarks.query_plans
+"""
+from benchmarks.common import benchmark_database, seed_board, setup, timed
+
+LISTS = 20
+TASKS_PER_LIST = 500
+
+
+def hot_queries(board):
+    from api.models import List, Task
+    board_list = board.lists.order_by('position')[LISTS // 2]
+    list_ids = list(board.lists.values_list('pk', flat=True))
+    return {
+        'board lists ordered': List.objects.filter(board=board).order_by('position'),
+        'list tasks ordered': Task.objects.filter(list=board_list).order_by('position'),
+        'prefetch tasks': Task.objects.filter(list_id__in=list_ids).order_by('position'),
+        'task at position': Task.objects.filter(list=board_list, position=TASKS_PER_LIST // 2),
+        'last position': Task.objects.filter(list=board_list).order_by('-position').values('position')[:1],
+    }
+
+
+def report(title, queries):
+    print(f'== {title}')
+    for name, queryset in queries.items():
+        plan = queryset.explain().replace('\n', ' | ')
+        print(f'{name:<22} {timed(lambda: list(queryset.all()), repeat=20):8.3f} ms  {plan}')
+
+
+def main():
+    setup()
+    from django.db import connection
+    from api.models import List, Task
+
+    with benchmark_database():
+        board = seed_board(LISTS, TASKS_PER_LIST)
+        queries = hot_queries(board)
+        report('with composite indexes', queries)
+
+        indexed_models = [(model, index) for model in (List, Task) for index in model._meta.indexes]
+        with connection.schema_editor() as schema_editor:
+            for model, index in indexed_models:
+                schema_editor.remove_index(model, index)
+        report('without composite indexes', queries)
+
+
+if __name__ == '__main__':
+    main()
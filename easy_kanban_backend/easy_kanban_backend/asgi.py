@@ -2,6 +2,10 @@
 ASGI config for easy_kanban_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests go to Django, WebSocket connections to the consumers in
+``api.routing``. With the ``ASYNC_READ_VIEWS`` setting on, HTTP requests are
+resolved with easy_kanban_backend/async_urls.py, which serves the hot reads
+from the async views of api/async_views.py.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -9,8 +13,33 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from channels.routing import ProtocolTypeRouter, URLRouter
+from channels.security.websocket import OriginValidator
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'easy_kanban_backend.settings')
 
-application = get_asgi_application()
+
+class ReadViewsASGIHandler(ASGIHandler):
+    """Django's ASGI handler, resolving requests with the async read views when ASYNC_READ_VIEWS is on."""
+
+    def create_request(self, scope, body_file):
+        request, error_response = super().create_request(scope, body_file)
+        if request is not None and settings.ASYNC_READ_VIEWS:
+            request.urlconf = 'easy_kanban_backend.async_urls'
+        return request, error_response
+
+
+# what get_asgi_application() does, with the handler above
+django.setup(set_prefix=False)
+django_asgi_application = ReadViewsASGIHandler()
+
+# imported once the app registry is ready
+from api.routing import websocket_urlpatterns  # noqa: E402
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_application,
+    'websocket': OriginValidator(URLRouter(websocket_urlpatterns), settings.CSRF_TRUSTED_ORIGINS),
+})
@@ -0,0 +1,13 @@
+"""
+URL configuration used for ASGI requests when the ASYNC_READ_VIEWS setting is on.
+
+The async read views of api/async_views.py take over their URLs, everything
+else is routed by easy_kanban_backend/urls.py.
+"""
+from django.urls import path, include
+
+from easy_kanban_backend.urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path('api/', include('api.async_urls')),
+] + sync_urlpatterns
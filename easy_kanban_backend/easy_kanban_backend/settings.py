@@ -33,6 +33,8 @@ ALLOWED_HOSTS = getenv('ALLOWED_HOSTS','localhost').split(',')
 # Application definition
 
 INSTALLED_APPS = [
+    # serves ASGI_APPLICATION (HTTP and WebSockets) from runserver
+    'daphne',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -75,17 +77,86 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'easy_kanban_backend.wsgi.application'
 
+ASGI_APPLICATION = 'easy_kanban_backend.asgi.application'
+
+# Channel layer carrying board events to WebSocket consumers, the in-memory layer only reaches
+# consumers of the same process, use e.g. channels_redis.core.RedisChannelLayer across several
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': getenv('CHANNEL_LAYER_BACKEND', 'channels.layers.InMemoryChannelLayer'),
+    },
+}
+if getenv('CHANNEL_LAYER_HOSTS'):
+    CHANNEL_LAYERS['default']['CONFIG'] = {'hosts': getenv('CHANNEL_LAYER_HOSTS').split(',')}
 
-# Database
-# https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
+# Cache
+# https://docs.djangoproject.com/en/5.0/ref/settings/#caches
+
+# Cache backend shared by the workers, the default per-process memory cache is not shared, use e.g.
+# django.core.cache.backends.redis.RedisCache with CACHE_LOCATION=redis://127.0.0.1:6379 (pip install redis)
+# or django.core.cache.backends.filebased.FileBasedCache with a directory as CACHE_LOCATION
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': getenv('CACHE_LOCATION', ''),
+        'KEY_PREFIX': getenv('CACHE_KEY_PREFIX', 'easy_kanban'),
     }
 }
 
+# Database
+# https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+
+# Database profile, 'sqlite' (default) or 'postgresql' for production
+DB_ENGINE = getenv('DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': getenv('DB_NAME', 'easy_kanban'),
+            'USER': getenv('DB_USER', 'postgres'),
+            'PASSWORD': getenv('DB_PASSWORD', ''),
+            'HOST': getenv('DB_HOST', 'localhost'),
+            'PORT': getenv('DB_PORT', '5432'),
+            # check connections before reuse; DB_CONN_MAX_AGE keeps them open across requests when DB_POOL is off,
+            # which only pays off under WSGI, under ASGI every request thread opens a connection of its own
+            'CONN_MAX_AGE': int(getenv('DB_CONN_MAX_AGE', 0)),
+            'CONN_HEALTH_CHECKS': True,
+            # required behind transaction-pooling proxies such as PgBouncer
+            'DISABLE_SERVER_SIDE_CURSORS': getenv('DB_DISABLE_SERVER_SIDE_CURSORS', 'False').lower() in ('true', '1', 't'),
+            'OPTIONS': {},
+        }
+    }
+    # psycopg connection pool (needs psycopg[pool]), it replaces persistent connections and is the default
+    # since the app is served through ASGI (daphne), where Django advises against persistent connections
+    if getenv('DB_POOL', 'True').lower() in ('true', '1', 't'):
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(getenv('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(getenv('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(getenv('DB_POOL_TIMEOUT', 10)),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': getenv('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # WAL lets readers run alongside the single writer, NORMAL only syncs at checkpoints in WAL
+                # mode, busy_timeout waits for the write lock instead of failing and mmap_size maps 128 MB
+                'init_command': (
+                    'PRAGMA journal_mode=WAL;'
+                    'PRAGMA synchronous=NORMAL;'
+                    'PRAGMA busy_timeout=5000;'
+                    'PRAGMA mmap_size=134217728;'
+                ),
+                # take the write lock when a transaction begins, upgrading a read lock later fails without waiting
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -137,11 +208,42 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
         'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
+    ),
+    # orjson backed when it is installed (pip install orjson), same output as DRF's JSON classes otherwise
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
-
 }
     
+# Seconds a serialized board stays in the cache, entries are keyed by board version so they never go stale
+BOARD_CACHE_TIMEOUT = int(getenv('BOARD_CACHE_TIMEOUT', 60 * 60))
+
+# Seconds the user resolved from an access token stays in the cache, saving or deleting the user drops it
+AUTH_USER_CACHE_TIMEOUT = int(getenv('AUTH_USER_CACHE_TIMEOUT', 60))
+
+# Put the user's board ids in access tokens and authorize board members from them (see api/memberships.py),
+# needs a CACHE_BACKEND shared by all workers
+MEMBERSHIP_CLAIMS = getenv('MEMBERSHIP_CLAIMS', 'False').lower() in ('true', '1', 't')
+
+# Ordering of lists and tasks, 'dense' (consecutive positions) or 'sparse' (gapped positions, see api/ordering.py)
+POSITION_ORDERING = getenv('POSITION_ORDERING', 'dense')
+
+# Render full board, list and task reads from values() rows instead of DRF serializers (see api/fastpath.py)
+FAST_READ_RENDERING = getenv('FAST_READ_RENDERING', 'False').lower() in ('true', '1', 't')
+
+# Serve board, list and task reads from the async views of api/async_views.py when running under ASGI
+ASYNC_READ_VIEWS = getenv('ASYNC_READ_VIEWS', 'False').lower() in ('true', '1', 't')
+
+# Dotted path of the task search backend, chosen from the database vendor when empty (see api/search.py)
+SEARCH_BACKEND = getenv('SEARCH_BACKEND', '')
+
 CSRF_TRUSTED_ORIGINS = getenv('FRONTEND_URL', 'http://127.0.0.1:5173').split(',')
 
 
@@ -160,4 +262,6 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_OBTAIN_SERIALIZER': 'api.serializers.MembershipTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'api.serializers.MembershipTokenRefreshSerializer',
 }
\ No newline at end of file